@@ -1,4 +1,25 @@
+import os
 import sys
+import math
+import time
+import argparse
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+# numpy нужен только для пакетного режима
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Относительный допуск для дискриминанта: |D| в пределах нескольких ulp от B² и 4AC
+# считается нулём (кратный корень), а не результатом ошибки округления
+DISCRIMINANT_RTOL = 4 * sys.float_info.epsilon
+
+# Режимы точности пакетного решателя: float32 вдвое быстрее на больших массивах
+PRECISIONS = ('float64', 'float32')
 
 def is_valid_float(value):
     """Проверяет, можно ли преобразовать значение в действительное число"""
@@ -32,6 +53,137 @@ def get_coefficient(prompt, param_value=None):
         except KeyboardInterrupt:
             print("\nПрограмма прервана пользователем.")
             sys.exit(0)
+        except EOFError:
+            # Ввод закончился (например, stdin перенаправлен из файла) - ждать нечего
+            print("\nОшибка: входные данные закончились, коэффициент не получен.")
+            sys.exit(1)
+
+def stable_quadratic_roots(A, B, C):
+    """
+    Корни квадратного уравнения A*t² + B*t + C = 0 по устойчивой формуле:
+    q = -(B + sign(B)*√D) / 2, t1 = q / A, t2 = C / q.
+    В отличие от (-B ± √D) / (2A) здесь не вычитаются близкие числа.
+    
+    Returns:
+        Кортеж (t1, t2) или None, если D < 0. При кратном корне t1 == t2.
+    """
+    D = B*B - 4*A*C
+    if abs(D) <= DISCRIMINANT_RTOL * max(B*B, abs(4*A*C)):
+        D = 0.0
+    
+    if D < 0:
+        return None
+    
+    q = -0.5 * (B + math.copysign(math.sqrt(D), B))
+    t1 = q / A
+    # q = 0 только при B = 0 и D = 0, т.е. при C = 0: оба корня нулевые
+    t2 = C / q if q != 0 and D != 0 else t1
+    return t1, t2
+
+def roots_from_t(t1, t2):
+    """Действительные корни x по корням t = x² (без повторов, по возрастанию)"""
+    real_roots = []
+    for t in ((t1,) if t1 == t2 else (t1, t2)):
+        if t > 0:
+            real_roots.extend([-math.sqrt(t), math.sqrt(t)])
+        elif t == 0:
+            real_roots.append(0.0)
+    return sorted(real_roots)
+
+class BiquadraticCache:
+    """
+    Ограниченный LRU-кэш решений биквадратных уравнений.
+    
+    Ключ - нормализованная пара (B/A, C/A), поэтому уравнения, отличающиеся
+    только множителем, решаются один раз. Для единообразия результатов
+    решается всегда нормализованное уравнение x⁴ + (B/A)*x² + C/A = 0.
+    """
+    
+    # Накладные расходы на узел OrderedDict и ссылки на ключ/значение
+    ENTRY_OVERHEAD = 104
+    
+    def __init__(self, max_entries=None, max_bytes=64 * 1024 * 1024):
+        """
+        Args:
+            max_entries: Максимальное количество записей (None - без ограничения)
+            max_bytes: Ограничение на оценку занимаемой памяти в байтах
+        """
+        if max_bytes <= 0 or (max_entries is not None and max_entries <= 0):
+            raise ValueError("Ограничения кэша должны быть положительными")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self.memory = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    @classmethod
+    def _entry_size(cls, key, roots):
+        """Оценка памяти под одну запись"""
+        floats = sys.getsizeof(0.0) * (len(key) + len(roots))
+        return cls.ENTRY_OVERHEAD + sys.getsizeof(key) + sys.getsizeof(roots) + floats
+    
+    def solve(self, A, B, C):
+        """
+        Возвращает кортеж действительных корней по возрастанию.
+        Повторные уравнения берутся из кэша без решения.
+        """
+        if A == 0:
+            raise ValueError("Коэффициент A не может быть равен 0 для биквадратного уравнения")
+        
+        key = (B / A, C / A)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+        
+        self.misses += 1
+        t_roots = stable_quadratic_roots(1.0, key[0], key[1])
+        roots = tuple(roots_from_t(*t_roots)) if t_roots is not None else ()
+        
+        size = self._entry_size(key, roots)
+        self._entries[key] = (roots, size)
+        self.memory += size
+        self._evict()
+        return roots
+    
+    def _evict(self):
+        """Вытесняет давно не использованные записи при превышении ограничений"""
+        while self._entries and (
+            self.memory > self.max_bytes
+            or (self.max_entries is not None and len(self._entries) > self.max_entries)
+        ):
+            _, (_, size) = self._entries.popitem(last=False)
+            self.memory -= size
+            self.evictions += 1
+    
+    def solve_many(self, triples):
+        """Генератор решений для последовательности троек (A, B, C)"""
+        for A, B, C in triples:
+            yield self.solve(A, B, C)
+    
+    def stats(self):
+        """Счётчики попаданий, промахов и вытеснений"""
+        requests = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self._entries),
+            'memory_bytes': self.memory,
+            'hit_rate': self.hits / requests if requests else 0.0,
+        }
+    
+    def clear(self):
+        """Очищает кэш и сбрасывает счётчики"""
+        self._entries.clear()
+        self.memory = 0
+        self.hits = self.misses = self.evictions = 0
 
 def solve_biquadratic():
     """Основная функция решения биквадратного уравнения"""
@@ -63,35 +215,15 @@ def solve_biquadratic():
     D = B**2 - 4*A*C
     print(f"Дискриминант D = {D}")
     
-    if D < 0:
+    t_roots = stable_quadratic_roots(A, B, C)
+    if t_roots is None:
         print("Дискриминант отрицательный. Действительных корней нет.")
         return
     
-    # Вычисляем корни квадратного уравнения относительно t
-    t1 = (-B + D**0.5) / (2*A)
-    t2 = (-B - D**0.5) / (2*A)
-    
+    t1, t2 = t_roots
     print(f"Корни относительно t = x²: t1 = {t1}, t2 = {t2}")
     
-    real_roots = []
-    
-    # Находим действительные корни биквадратного уравнения
-    if t1 >= 0:
-        root1 = t1**0.5
-        root2 = -t1**0.5
-        real_roots.extend([root1, root2])
-        if t1 == 0:  # Если корень нулевой, он будет повторяться
-            real_roots = list(set(real_roots))  # Убираем дубликаты
-    
-    if t2 >= 0 and t2 != t1:  # Проверяем t2, если оно отличается от t1
-        root3 = t2**0.5
-        root4 = -t2**0.5
-        real_roots.extend([root3, root4])
-        if t2 == 0:  # Если корень нулевой, он будет повторяться
-            real_roots = list(set(real_roots))  # Убираем дубликаты
-    
-    # Убираем дубликаты и сортируем
-    real_roots = sorted(list(set(real_roots)))
+    real_roots = roots_from_t(t1, t2)
     
     if real_roots:
         print(f"Действительные корни уравнения: {real_roots}")
@@ -99,8 +231,337 @@ def solve_biquadratic():
     else:
         print("Действительных корней нет.")
 
+def _require_numpy():
+    """Проверяет наличие numpy для пакетного режима"""
+    if not NUMPY_AVAILABLE:
+        raise ImportError("Для пакетного режима требуется numpy. Установите: pip install numpy")
+
+def load_coefficients(path):
+    """
+    Загружает коэффициенты из файла .npy или текстового файла (CSV).
+    Каждая строка файла - одно уравнение: A, B, C.
+    
+    Returns:
+        Кортеж массивов (A, B, C)
+    """
+    _require_numpy()
+    if str(path).endswith('.npy'):
+        data = np.load(path)
+    else:
+        delimiter = ',' if str(path).endswith('.csv') else None
+        data = np.loadtxt(path, delimiter=delimiter, ndmin=2)
+    
+    if data.ndim != 2 or data.shape[1] != 3:
+        raise ValueError(f"Ожидается массив формы (n, 3), получено {data.shape}")
+    
+    return data[:, 0], data[:, 1], data[:, 2]
+
+def _biquadratic_kernel(A, B, C):
+    """
+    Векторизованное ядро: вычисляет корни для массивов коэффициентов.
+    Все шаги выполняются над целыми массивами без ветвлений по уравнениям.
+    Вычисления идут в типе входных массивов (float32 или float64).
+    
+    Используется устойчивая формула (см. stable_quadratic_roots); дискриминант,
+    близкий к нулю в пределах допуска, считается нулём, и t1, t2 совпадают точно.
+    """
+    rtol = 4 * np.finfo(A.dtype).eps
+    with np.errstate(invalid='ignore', divide='ignore', over='ignore'):
+        BB = B * B
+        AC4 = 4 * A * C
+        D = BB - AC4
+        D = np.where(np.abs(D) <= rtol * np.maximum(BB, np.abs(AC4)), 0, D)
+        
+        sqrt_d = np.sqrt(D)  # NaN при D < 0
+        q = -0.5 * (B + np.copysign(sqrt_d, B))
+        t1 = q / A
+        # При D = 0 корень кратный; q = 0 только при B = C = 0, тогда t2 = t1 = 0
+        t2 = np.where((q != 0) & (D != 0), C / q, t1)
+        
+        t_low = np.minimum(t1, t2)
+        t_high = np.maximum(t1, t2)
+        r_low = np.sqrt(t_low)  # NaN при t < 0
+        r_high = np.sqrt(t_high)
+    
+    nan = np.array(np.nan, dtype=A.dtype)
+    # Пара ±√t_low нужна, только если t_low отличается от t_high;
+    # при t = 0 остаётся единственный корень x = 0
+    low_distinct = t_low != t_high
+    candidates = np.stack([
+        -r_high,
+        np.where(low_distinct & (t_low > 0), -r_low, nan),
+        np.where(low_distinct, r_low, nan),
+        np.where(t_high > 0, r_high, nan),
+    ], axis=1)
+    candidates[:, 0] = np.where(t_high == 0, 0, candidates[:, 0])
+    
+    # При A = 0 уравнение не биквадратное
+    invalid = A == 0
+    candidates[invalid] = nan
+    
+    # np.sort переносит NaN в конец строки
+    roots = np.sort(candidates, axis=1)
+    counts = np.count_nonzero(~np.isnan(roots), axis=1).astype(np.int8)
+    counts[invalid] = -1
+    return roots, counts
+
+def _as_coefficients(A, B, C, precision):
+    """Приводит коэффициенты к массивам заданной точности и проверяет их форму"""
+    if precision not in PRECISIONS:
+        raise ValueError(f"Неизвестный режим точности '{precision}', допустимы: {', '.join(PRECISIONS)}")
+    
+    A = np.asarray(A, dtype=precision)
+    B = np.asarray(B, dtype=precision)
+    C = np.asarray(C, dtype=precision)
+    
+    if not (A.shape == B.shape == C.shape) or A.ndim != 1:
+        raise ValueError("Массивы коэффициентов должны быть одномерными и одинаковой длины")
+    
+    return A, B, C
+
+def solve_biquadratic_batch(A, B, C, precision='float64'):
+    """
+    Пакетное решение биквадратных уравнений A*x⁴ + B*x² + C = 0.
+    
+    Args:
+        A, B, C: Массивы (или последовательности) коэффициентов одинаковой длины
+        precision: 'float64' или 'float32' (быстрее, но менее точно)
+    
+    Returns:
+        roots: Массив (n, 4) с корнями по возрастанию, дополненный NaN
+        counts: Массив (n,) с количеством действительных корней
+                (-1, если A = 0 и уравнение не биквадратное)
+    """
+    _require_numpy()
+    return _biquadratic_kernel(*_as_coefficients(A, B, C, precision))
+
+def _solve_shared_chunk(coeffs_name, roots_name, counts_name, n, start, stop, precision):
+    """
+    Рабочий процесс: решает уравнения [start, stop) из разделяемой памяти
+    и записывает результаты туда же.
+    
+    Returns:
+        Кортеж (pid, количество уравнений, время в секундах)
+    """
+    start_time = time.perf_counter()
+    coeffs_shm = shared_memory.SharedMemory(name=coeffs_name)
+    roots_shm = shared_memory.SharedMemory(name=roots_name)
+    counts_shm = shared_memory.SharedMemory(name=counts_name)
+    try:
+        coeffs = np.ndarray((3, n), dtype=precision, buffer=coeffs_shm.buf)
+        roots = np.ndarray((n, 4), dtype=precision, buffer=roots_shm.buf)
+        counts = np.ndarray((n,), dtype=np.int8, buffer=counts_shm.buf)
+        
+        roots[start:stop], counts[start:stop] = _biquadratic_kernel(
+            coeffs[0, start:stop], coeffs[1, start:stop], coeffs[2, start:stop]
+        )
+        # Представления нужно освободить до закрытия разделяемой памяти
+        del coeffs, roots, counts
+    finally:
+        coeffs_shm.close()
+        roots_shm.close()
+        counts_shm.close()
+    
+    return os.getpid(), stop - start, time.perf_counter() - start_time
+
+def solve_biquadratic_parallel(A, B, C, workers=None, chunk_size=1_000_000, precision='float64'):
+    """
+    Параллельное пакетное решение на пуле процессов.
+    Коэффициенты и результаты передаются через разделяемую память,
+    каждый процесс записывает свою порцию на её место, поэтому порядок сохраняется.
+    
+    Args:
+        A, B, C: Массивы коэффициентов одинаковой длины
+        workers: Количество процессов (по умолчанию - число ядер)
+        chunk_size: Количество уравнений в одной порции
+        precision: 'float64' или 'float32'
+    
+    Returns:
+        roots, counts: Как в solve_biquadratic_batch
+        stats: Словарь pid -> {'equations', 'seconds', 'throughput'}
+    """
+    _require_numpy()
+    coeffs = np.stack(_as_coefficients(A, B, C, precision))
+    if chunk_size <= 0:
+        raise ValueError("Размер порции должен быть положительным")
+    
+    n = coeffs.shape[1]
+    # SharedMemory не допускает нулевой размер
+    coeffs_shm = shared_memory.SharedMemory(create=True, size=max(coeffs.nbytes, 1))
+    roots_shm = shared_memory.SharedMemory(create=True, size=max(n * 4 * coeffs.itemsize, 1))
+    counts_shm = shared_memory.SharedMemory(create=True, size=max(n, 1))
+    stats = {}
+    try:
+        np.ndarray(coeffs.shape, dtype=precision, buffer=coeffs_shm.buf)[:] = coeffs
+        del coeffs
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_solve_shared_chunk, coeffs_shm.name, roots_shm.name,
+                                counts_shm.name, n, start, min(start + chunk_size, n), precision)
+                for start in range(0, n, chunk_size)
+            ]
+            for future in futures:
+                pid, equations, seconds = future.result()
+                worker = stats.setdefault(pid, {'equations': 0, 'seconds': 0.0})
+                worker['equations'] += equations
+                worker['seconds'] += seconds
+        
+        roots = np.ndarray((n, 4), dtype=precision, buffer=roots_shm.buf).copy()
+        counts = np.ndarray((n,), dtype=np.int8, buffer=counts_shm.buf).copy()
+    finally:
+        for shm in (coeffs_shm, roots_shm, counts_shm):
+            shm.close()
+            shm.unlink()
+    
+    for worker in stats.values():
+        worker['throughput'] = worker['equations'] / worker['seconds'] if worker['seconds'] else 0.0
+    
+    return roots, counts, stats
+
+def run_batch(path, output=None, workers=None, chunk_size=1_000_000, precision='float64'):
+    """
+    Решает все уравнения из файла и выводит сводку.
+    Если задано количество процессов, используется параллельный режим.
+    """
+    A, B, C = load_coefficients(path)
+    
+    start_time = time.perf_counter()
+    if workers is None:
+        roots, counts = solve_biquadratic_batch(A, B, C, precision)
+    else:
+        roots, counts, stats = solve_biquadratic_parallel(A, B, C, workers, chunk_size, precision)
+    elapsed_time = time.perf_counter() - start_time
+    
+    print(f"Решено уравнений: {len(counts)} за {elapsed_time:.4f} секунд")
+    if workers is not None:
+        print(f"Процессов: {workers}, размер порции: {chunk_size}")
+        for pid, worker in sorted(stats.items()):
+            print(f"  Процесс {pid}: {worker['equations']} уравнений, "
+                  f"{worker['throughput']:.0f} уравнений/с")
+    for count in range(5):
+        print(f"  С {count} действительными корнями: {np.count_nonzero(counts == count)}")
+    print(f"  Не биквадратных (A = 0): {np.count_nonzero(counts == -1)}")
+    
+    if output is not None:
+        np.savez(output, roots=roots, counts=counts)
+        print(f"Результаты сохранены в файл: {output}")
+    
+    return roots, counts
+
+def iter_coefficient_chunks(stream, chunk_size=65536, errors=None):
+    """
+    Читает строки вида "A B C" (или "A,B,C") из потока порциями фиксированного размера.
+    Некорректные строки выводятся в поток ошибок и пропускаются.
+    
+    Yields:
+        Массивы формы (k, 3), k <= chunk_size. Буфер переиспользуется,
+        поэтому порцию нужно обработать до запроса следующей.
+    """
+    _require_numpy()
+    if chunk_size <= 0:
+        raise ValueError("Размер порции должен быть положительным")
+    errors = errors if errors is not None else sys.stderr
+    buffer = np.empty((chunk_size, 3), dtype=np.float64)
+    count = 0
+    
+    for line_number, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        
+        parts = line.replace(',', ' ').split()
+        try:
+            if len(parts) != 3:
+                raise ValueError
+            buffer[count] = parts  # numpy сам преобразует строки в числа
+        except ValueError:
+            print(f"Строка {line_number}: некорректные данные '{line}'", file=errors)
+            continue
+        
+        count += 1
+        if count == chunk_size:
+            yield buffer
+            count = 0
+    
+    if count:
+        yield buffer[:count]
+
+def run_stream(source, output, chunk_size=65536, precision='float64'):
+    """
+    Потоковый режим: решает уравнения порциями и сразу записывает результаты.
+    Объём памяти не зависит от размера входных данных.
+    
+    Формат выходной строки: A B C количество x1 x2 x3 x4 (отсутствующие корни - nan)
+    """
+    if precision not in PRECISIONS:
+        raise ValueError(f"Неизвестный режим точности '{precision}', допустимы: {', '.join(PRECISIONS)}")
+    
+    # Для float32 значимы только 9 цифр
+    root_fmt = '%.17g' if precision == 'float64' else '%.9g'
+    fmt = ['%.17g'] * 3 + ['%d'] + [root_fmt] * 4
+    total = 0
+    
+    for chunk in iter_coefficient_chunks(source, chunk_size):
+        coeffs = chunk.T.astype(precision)
+        roots, counts = _biquadratic_kernel(coeffs[0], coeffs[1], coeffs[2])
+        np.savetxt(output, np.column_stack([chunk, counts, roots]), fmt=fmt)
+        total += len(counts)
+    
+    output.flush()
+    return total
+
+def _open_input(path):
+    """Открывает входной файл; '-' означает стандартный ввод"""
+    if path == '-':
+        return sys.stdin
+    return open(path, 'r', encoding='utf-8')
+
+def run_cli(argv):
+    """Неинтерактивные режимы работы программы"""
+    parser = argparse.ArgumentParser(description="Решение биквадратных уравнений A*x⁴ + B*x² + C = 0")
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument('--batch', metavar='FILE',
+                      help="файл с коэффициентами (.npy или CSV, по уравнению на строку)")
+    mode.add_argument('--stream', metavar='FILE', nargs='?', const='-',
+                      help="потоковый режим: строки 'A B C' из файла или stdin (по умолчанию)")
+    parser.add_argument('--output', metavar='FILE',
+                        help="файл для результатов (.npz в пакетном режиме, текст в потоковом)")
+    parser.add_argument('--chunk-size', type=int,
+                        help="количество уравнений в одной порции "
+                             "(по умолчанию 65536 в потоковом режиме и 1000000 в параллельном)")
+    parser.add_argument('--workers', type=int,
+                        help="количество процессов для параллельного пакетного режима")
+    parser.add_argument('--precision', choices=PRECISIONS, default='float64',
+                        help="точность вычислений (float32 быстрее на больших массивах)")
+    args = parser.parse_args(argv)
+    if args.chunk_size is not None and args.chunk_size <= 0:
+        parser.error("--chunk-size должен быть положительным")
+    if args.workers is not None and args.stream is not None:
+        parser.error("--workers используется только с --batch")
+    
+    if args.batch is not None:
+        chunk_size = args.chunk_size if args.chunk_size is not None else 1_000_000
+        run_batch(args.batch, args.output, args.workers, chunk_size, args.precision)
+        return
+    
+    source = _open_input(args.stream)
+    output = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    try:
+        run_stream(source, output, args.chunk_size if args.chunk_size is not None else 65536, args.precision)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if output is not sys.stdout:
+            output.close()
+
 def main():
     """Главная функция программы"""
+    # Параметры вида --batch / --stream включают неинтерактивный режим
+    if len(sys.argv) > 1 and sys.argv[1].startswith('--'):
+        run_cli(sys.argv[1:])
+        return
+    
     print("Программа для решения биквадратного уравнения")
     print("Биквадратное уравнение: A*x⁴ + B*x² + C = 0")
     
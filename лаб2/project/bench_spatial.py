@@ -0,0 +1,85 @@
+"""
+Сравнение сеточного индекса с полным перебором на большой коллекции фигур.
+
+Запуск: python bench_spatial.py [количество фигур] [количество запросов]
+"""
+import sys
+import time
+import numpy as np
+from lab_python_oop.collection import FigureCollection, KIND_CIRCLE
+from lab_python_oop.spatial import GridIndex
+
+def make_collection(count, seed=0):
+    """Случайные фигуры на поле 10000 x 10000"""
+    rng = np.random.default_rng(seed)
+    collection = FigureCollection(capacity=count)
+    collection.add_arrays(
+        rng.integers(0, 3, count),
+        rng.uniform(1, 20, count),
+        rng.uniform(1, 20, count),
+        rng.choice(["красного", "зеленого", "синего"], count),
+        x=rng.uniform(0, 10000, count),
+        y=rng.uniform(0, 10000, count),
+    )
+    return collection
+
+def brute_bbox(collection, xmin, ymin, xmax, ymax):
+    half_x, half_y = collection.half_extents()
+    x, y = collection.x, collection.y
+    mask = (x - half_x <= xmax) & (x + half_x >= xmin) & (y - half_y <= ymax) & (y + half_y >= ymin)
+    return np.flatnonzero(mask)
+
+def brute_point(collection, px, py):
+    half_x, half_y = collection.half_extents()
+    dx, dy = px - collection.x, py - collection.y
+    inside = np.where(collection.kinds == KIND_CIRCLE,
+                      dx * dx + dy * dy <= half_x * half_x,
+                      (np.abs(dx) <= half_x) & (np.abs(dy) <= half_y))
+    return np.flatnonzero(inside)
+
+def brute_nearest(collection, px, py, k):
+    distances = (collection.x - px) ** 2 + (collection.y - py) ** 2
+    nearest = np.argpartition(distances, k)[:k]
+    return nearest[np.lexsort((nearest, distances[nearest]))]
+
+def measure(function, queries):
+    """Среднее время одного запроса в миллисекундах и результаты"""
+    start_time = time.perf_counter()
+    results = [function(*query) for query in queries]
+    return (time.perf_counter() - start_time) / len(queries) * 1000, results
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    query_count = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+    print(f"Фигур: {count}, запросов каждого вида: {query_count}")
+    print("=" * 50)
+
+    collection = make_collection(count)
+    start_time = time.perf_counter()
+    index = GridIndex(collection).bulk_load()
+    print(f"Построение индекса: {time.perf_counter() - start_time:.3f} секунд")
+    print(index)
+
+    rng = np.random.default_rng(1)
+    points = rng.uniform(0, 10000, (query_count, 2))
+    boxes = [(x, y, x + 100, y + 100) for x, y in points.tolist()]
+    point_queries = [tuple(point) for point in points.tolist()]
+    nearest_queries = [(x, y, 10) for x, y in points.tolist()]
+
+    cases = [
+        ("Прямоугольная область", index.query_bbox, lambda *q: brute_bbox(collection, *q), boxes),
+        ("Точка внутри фигуры", index.query_point, lambda *q: brute_point(collection, *q), point_queries),
+        ("10 ближайших", index.nearest, lambda *q: brute_nearest(collection, *q), nearest_queries),
+    ]
+
+    print("\n{:<24}{:>12}{:>14}{:>10}".format("Запрос", "Индекс, мс", "Перебор, мс", "Ускорение"))
+    for title, indexed, brute, queries in cases:
+        indexed_time, indexed_results = measure(indexed, queries)
+        brute_time, brute_results = measure(brute, queries)
+        for got, expected in zip(indexed_results, brute_results):
+            assert np.array_equal(got, expected), f"Результаты не совпадают: {title}"
+        print("{:<24}{:>12.3f}{:>14.3f}{:>9.0f}x".format(title, indexed_time, brute_time, brute_time / indexed_time))
+
+if __name__ == "__main__":
+    main()
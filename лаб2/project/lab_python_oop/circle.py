@@ -5,24 +5,39 @@ from .color import FigureColor
 class Circle(Figure):
     """Класс Круг"""
     
-    def __init__(self, radius, color):
+    __slots__ = ('_radius', 'color_property', 'position', '_name', '_area_text')
+    
+    # Шаблон описания: название, цвет, радиус, площадь (общий с FigureRenderer)
+    TEMPLATE = "{} {} цвета радиусом {} площадью {}"
+    
+    def __init__(self, radius, color, position=None):
         self.radius = radius
         self.color_property = FigureColor()
         self.color_property.color = color
+        self.position = position  # центр круга (x, y) или None, если фигура не размещена
         self._name = "Круг"
     
     @property
     def name(self):
         return self._name
     
+    @property
+    def radius(self):
+        return self._radius
+    
+    @radius.setter
+    def radius(self, value):
+        self._radius = value
+        self._area_text = None
+    
     def area(self):
         """Вычисление площади круга"""
         return math.pi * self.radius ** 2
     
     def __repr__(self):
-        return "{} {} цвета радиусом {} площадью {:.2f}".format(
+        return self.TEMPLATE.format(
             self.name, 
             self.color_property.color, 
-            self.radius, 
-            self.area()
+            self._radius, 
+            self.area_text()
         )
\ No newline at end of file
@@ -0,0 +1,287 @@
+import math
+import numpy as np
+from .rectangle import Rectangle
+from .circle import Circle
+from .square import Square
+
+# Коды типов фигур в столбце kinds
+KIND_RECTANGLE = 0
+KIND_CIRCLE = 1
+KIND_SQUARE = 2
+
+KIND_NAMES = {
+    KIND_RECTANGLE: "Прямоугольник",
+    KIND_CIRCLE: "Круг",
+    KIND_SQUARE: "Квадрат",
+}
+
+class FigureCollection:
+    """
+    Компактная коллекция фигур в виде структуры массивов.
+
+    Вместо объекта на каждую фигуру хранятся непрерывные столбцы:
+    код типа, два размера (ширина/высота, радиус или сторона), координаты
+    центра (NaN у неразмещённых фигур) и индекс цвета в таблице цветов,
+    где каждая строка цвета хранится один раз.
+    Объекты Rectangle, Circle и Square создаются только при обращении к элементу.
+    """
+
+    def __init__(self, capacity=1024):
+        self._size = 0
+        self._kinds = np.empty(capacity, dtype=np.uint8)
+        self._dim1 = np.empty(capacity, dtype=np.float64)
+        self._dim2 = np.empty(capacity, dtype=np.float64)
+        self._x = np.empty(capacity, dtype=np.float64)
+        self._y = np.empty(capacity, dtype=np.float64)
+        self._colors = np.empty(capacity, dtype=np.int32)
+        self._color_table = []
+        self._color_codes = {}
+
+    @classmethod
+    def from_arrays(cls, kinds, dim1, dim2, colors, color_table, x=None, y=None):
+        """
+        Создаёт коллекцию из готовых столбцов без копирования.
+
+        Args:
+            kinds: Коды типов фигур
+            dim1, dim2: Размеры фигур
+            colors: Индексы цветов в color_table
+            color_table: Список строк цветов
+            x, y: Координаты центров (по умолчанию фигуры не размещены)
+        """
+        collection = cls(capacity=0)
+        collection._kinds = np.asarray(kinds, dtype=np.uint8)
+        collection._dim1 = np.asarray(dim1, dtype=np.float64)
+        collection._dim2 = np.asarray(dim2, dtype=np.float64)
+        count = len(collection._kinds)
+        collection._x = np.asarray(x, dtype=np.float64) if x is not None else np.full(count, np.nan)
+        collection._y = np.asarray(y, dtype=np.float64) if y is not None else np.full(count, np.nan)
+        collection._colors = np.asarray(colors, dtype=np.int32)
+        collection._size = len(collection._kinds)
+        collection._color_table = list(color_table)
+        collection._color_codes = {color: code for code, color in enumerate(collection._color_table)}
+        return collection
+
+    @classmethod
+    def from_figures(cls, figures):
+        """Создаёт коллекцию из объектов фигур"""
+        collection = cls()
+        collection.extend(figures)
+        return collection
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def kinds(self):
+        """Коды типов фигур"""
+        return self._kinds[:self._size]
+
+    @property
+    def dim1(self):
+        """Ширина прямоугольника, радиус круга или сторона квадрата"""
+        return self._dim1[:self._size]
+
+    @property
+    def dim2(self):
+        """Высота прямоугольника или сторона квадрата (для круга - радиус)"""
+        return self._dim2[:self._size]
+
+    @property
+    def x(self):
+        """Абсцисса центра фигуры (NaN, если фигура не размещена)"""
+        return self._x[:self._size]
+
+    @property
+    def y(self):
+        """Ордината центра фигуры (NaN, если фигура не размещена)"""
+        return self._y[:self._size]
+
+    @property
+    def colors(self):
+        """Индексы цветов в таблице цветов"""
+        return self._colors[:self._size]
+
+    @property
+    def color_table(self):
+        """Таблица цветов: индекс -> строка цвета"""
+        return self._color_table
+
+    @property
+    def nbytes(self):
+        """Объём памяти, занятый столбцами"""
+        columns = (self._kinds, self._dim1, self._dim2, self._x, self._y, self._colors)
+        return sum(column.nbytes for column in columns)
+
+    def intern_color(self, color):
+        """Возвращает индекс цвета, добавляя его в таблицу при первом появлении"""
+        code = self._color_codes.get(color)
+        if code is None:
+            code = len(self._color_table)
+            self._color_table.append(color)
+            self._color_codes[color] = code
+        return code
+
+    def _reserve(self, count):
+        """Увеличивает ёмкость столбцов (с запасом) под count новых фигур"""
+        required = self._size + count
+        capacity = len(self._kinds)
+        if required <= capacity:
+            return
+
+        capacity = max(required, capacity * 2, 16)
+        for name in ('_kinds', '_dim1', '_dim2', '_x', '_y', '_colors'):
+            column = getattr(self, name)
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            setattr(self, name, grown)
+
+    def _add(self, kind, dim1, dim2, color, position):
+        self._reserve(1)
+        index = self._size
+        self._kinds[index] = kind
+        self._dim1[index] = dim1
+        self._dim2[index] = dim2
+        self._x[index], self._y[index] = position if position is not None else (np.nan, np.nan)
+        self._colors[index] = self.intern_color(color)
+        self._size += 1
+        return index
+
+    def add_rectangle(self, width, height, color, position=None):
+        """Добавляет прямоугольник и возвращает его индекс"""
+        return self._add(KIND_RECTANGLE, width, height, color, position)
+
+    def add_circle(self, radius, color, position=None):
+        """Добавляет круг и возвращает его индекс"""
+        return self._add(KIND_CIRCLE, radius, radius, color, position)
+
+    def add_square(self, side, color, position=None):
+        """Добавляет квадрат и возвращает его индекс"""
+        return self._add(KIND_SQUARE, side, side, color, position)
+
+    def append(self, figure):
+        """Добавляет объект фигуры, сохраняя только его данные; возвращает индекс"""
+        color = figure.color_property.color
+        # Square проверяется раньше Rectangle, так как наследуется от него
+        if isinstance(figure, Square):
+            return self.add_square(figure.width, color, figure.position)
+        elif isinstance(figure, Rectangle):
+            return self.add_rectangle(figure.width, figure.height, color, figure.position)
+        elif isinstance(figure, Circle):
+            return self.add_circle(figure.radius, color, figure.position)
+        else:
+            raise TypeError(f"Неизвестный тип фигуры: {type(figure).__name__}")
+
+    def extend(self, figures):
+        for figure in figures:
+            self.append(figure)
+
+    def add_arrays(self, kinds, dim1, dim2, colors, x=None, y=None):
+        """
+        Массовое добавление фигур из массивов.
+
+        Args:
+            kinds: Коды типов (KIND_RECTANGLE, KIND_CIRCLE, KIND_SQUARE)
+            dim1, dim2: Размеры фигур (для кругов и квадратов dim2 не используется)
+            colors: Цвета (строки или None)
+            x, y: Координаты центров (по умолчанию фигуры не размещены)
+        """
+        kinds = np.asarray(kinds, dtype=np.uint8)
+        dim1 = np.asarray(dim1, dtype=np.float64)
+        # У круга и квадрата оба размера совпадают, как и в add_circle/add_square
+        dim2 = np.where(kinds == KIND_RECTANGLE, np.asarray(dim2, dtype=np.float64), dim1)
+        count = len(kinds)
+        if not (len(dim1) == len(dim2) == len(colors) == count):
+            raise ValueError("Все массивы должны быть одинаковой длины")
+        if count and kinds.max() > KIND_SQUARE:
+            raise ValueError("Неизвестный код типа фигуры")
+
+        # Каждый различный цвет интернируется один раз; словарь не сортирует
+        # цвета, поэтому допустимы None и цвета разных типов
+        color_codes = {color: self.intern_color(color) for color in dict.fromkeys(colors)}
+        codes = np.fromiter(map(color_codes.__getitem__, colors), dtype=np.int32, count=count)
+
+        self._reserve(count)
+        end = self._size + count
+        self._kinds[self._size:end] = kinds
+        self._dim1[self._size:end] = dim1
+        self._dim2[self._size:end] = dim2
+        self._x[self._size:end] = x if x is not None else np.nan
+        self._y[self._size:end] = y if y is not None else np.nan
+        self._colors[self._size:end] = codes
+        self._size = end
+
+    def half_extents(self):
+        """Половины ширины и высоты описанных прямоугольников фигур"""
+        is_circle = self.kinds == KIND_CIRCLE
+        return np.where(is_circle, self.dim1, self.dim1 / 2), np.where(is_circle, self.dim2, self.dim2 / 2)
+
+    def areas(self):
+        """Площади всех фигур, вычисленные одним векторным проходом"""
+        kinds = self.kinds
+        dim1 = self.dim1
+        return np.where(kinds == KIND_CIRCLE, math.pi * dim1 * dim1, dim1 * self.dim2)
+
+    @staticmethod
+    def _aggregate(groups, areas, labels):
+        """Количество, суммарная и средняя площадь по группам"""
+        minlength = len(labels)
+        counts = np.bincount(groups, minlength=minlength)
+        totals = np.bincount(groups, weights=areas, minlength=minlength)
+
+        result = {}
+        for code, label in enumerate(labels):
+            if counts[code]:
+                result[label] = {
+                    'count': int(counts[code]),
+                    'total': float(totals[code]),
+                    'mean': float(totals[code] / counts[code]),
+                }
+        return result
+
+    def area_by_kind(self):
+        """Агрегаты площади по типу фигуры: {название: {'count', 'total', 'mean'}}"""
+        labels = [KIND_NAMES[kind] for kind in sorted(KIND_NAMES)]
+        return self._aggregate(self.kinds, self.areas(), labels)
+
+    def area_by_color(self):
+        """Агрегаты площади по цвету: {цвет: {'count', 'total', 'mean'}}"""
+        return self._aggregate(self.colors, self.areas(), self._color_table)
+
+    def _make_figure(self, index):
+        """Создаёт объект фигуры по данным элемента"""
+        kind = self._kinds[index]
+        color = self._color_table[self._colors[index]]
+        x, y = float(self._x[index]), float(self._y[index])
+        position = None if math.isnan(x) else (x, y)
+        if kind == KIND_RECTANGLE:
+            return Rectangle(float(self._dim1[index]), float(self._dim2[index]), color, position)
+        if kind == KIND_CIRCLE:
+            return Circle(float(self._dim1[index]), color, position)
+        return Square(float(self._dim1[index]), color, position)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            # Срез применяется к представлениям длины _size, а не к буферам с запасом:
+            # иначе для [::-1] конец -1 означал бы последний элемент буфера
+            return FigureCollection.from_arrays(
+                self.kinds[index], self.dim1[index], self.dim2[index], self.colors[index],
+                self._color_table, self.x[index], self.y[index],
+            )
+
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("Индекс за пределами коллекции")
+        return self._make_figure(index)
+
+    def __iter__(self):
+        for index in range(self._size):
+            yield self._make_figure(index)
+
+    def __repr__(self):
+        return "Коллекция из {} фигур ({} цветов, {} байт)".format(
+            self._size,
+            len(self._color_table),
+            self.nbytes
+        )
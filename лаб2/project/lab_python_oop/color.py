@@ -1,6 +1,8 @@
 class FigureColor:
     """Класс Цвет фигуры"""
     
+    __slots__ = ('_color',)
+    
     def __init__(self):
         self._color = None
     
@@ -3,6 +3,11 @@ from abc import ABC, abstractmethod
 class Figure(ABC):
     """Абстрактный класс Геометрическая фигура"""
     
+    __slots__ = ()
+    
+    # Формат площади в описании фигуры
+    AREA_FORMAT = "{:.2f}"
+    
     @abstractmethod
     def area(self):
         """Абстрактный метод для вычисления площади"""
@@ -12,4 +17,13 @@ class Figure(ABC):
     @abstractmethod
     def name(self):
         """Абстрактное свойство для названия фигуры"""
-        pass
\ No newline at end of file
+        pass
+    
+    def area_text(self):
+        """
+        Площадь, отформатированная для вывода.
+        Строка кэшируется; наследники сбрасывают _area_text при изменении размеров.
+        """
+        if self._area_text is None:
+            self._area_text = self.AREA_FORMAT.format(self.area())
+        return self._area_text
\ No newline at end of file
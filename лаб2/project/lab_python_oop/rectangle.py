@@ -4,26 +4,50 @@ from .color import FigureColor
 class Rectangle(Figure):
     """Класс Прямоугольник"""
     
-    def __init__(self, width, height, color):
+    __slots__ = ('_width', '_height', 'color_property', 'position', '_name', '_area_text')
+    
+    # Шаблон описания: название, цвет, ширина, высота, площадь (общий с FigureRenderer)
+    TEMPLATE = "{} {} цвета шириной {} и высотой {} площадью {}"
+    
+    def __init__(self, width, height, color, position=None):
         self.width = width
         self.height = height
         self.color_property = FigureColor()
         self.color_property.color = color
+        self.position = position  # центр фигуры (x, y) или None, если фигура не размещена
         self._name = "Прямоугольник"
     
     @property
     def name(self):
         return self._name
     
+    @property
+    def width(self):
+        return self._width
+    
+    @width.setter
+    def width(self, value):
+        self._width = value
+        self._area_text = None
+    
+    @property
+    def height(self):
+        return self._height
+    
+    @height.setter
+    def height(self, value):
+        self._height = value
+        self._area_text = None
+    
     def area(self):
         """Вычисление площади прямоугольника"""
         return self.width * self.height
     
     def __repr__(self):
-        return "{} {} цвета шириной {} и высотой {} площадью {:.2f}".format(
+        return self.TEMPLATE.format(
             self.name, 
             self.color_property.color, 
-            self.width, 
-            self.height, 
-            self.area()
+            self._width, 
+            self._height, 
+            self.area_text()
         )
\ No newline at end of file
@@ -0,0 +1,97 @@
+import sys
+from .figure import Figure
+from .rectangle import Rectangle
+from .circle import Circle
+from .square import Square
+from .collection import FigureCollection, KIND_RECTANGLE, KIND_CIRCLE, KIND_NAMES
+
+# Сброс оформления ANSI (то же, что colorama.Style.RESET_ALL)
+ANSI_RESET = "\033[0m"
+
+class FigureRenderer:
+    """
+    Буферизованный вывод описаний фигур.
+
+    Строки накапливаются в буфере и записываются в поток одной операцией
+    на каждые batch_size фигур. Коды ANSI добавляются, только если поток -
+    терминал (или это явно задано параметром use_color).
+    """
+
+    def __init__(self, stream=None, styles=None, use_color=None, batch_size=10000):
+        """
+        Args:
+            stream: Поток вывода (по умолчанию sys.stdout)
+            styles: Словарь {название фигуры: префикс ANSI}, например {"Круг": Fore.GREEN}
+            use_color: Выводить ли коды ANSI; по умолчанию - только для терминала
+            batch_size: Количество строк, записываемых за одну операцию
+        """
+        self.stream = stream if stream is not None else sys.stdout
+        self.styles = styles or {}
+        if use_color is None:
+            isatty = getattr(self.stream, 'isatty', None)
+            use_color = bool(isatty and isatty())
+        self.use_color = use_color and bool(self.styles)
+        self.batch_size = batch_size
+
+    def _decorate(self, name, text):
+        style = self.styles.get(name)
+        if style is None:
+            return text
+        return style + text + ANSI_RESET
+
+    def _figure_lines(self, figures):
+        if self.use_color:
+            for figure in figures:
+                yield self._decorate(figure.name, repr(figure))
+        else:
+            yield from map(repr, figures)
+
+    def _collection_lines(self, collection):
+        """Строки для коллекции без создания объектов фигур"""
+        areas = collection.areas().tolist()
+        columns = zip(collection.kinds.tolist(), collection.colors.tolist(),
+                      collection.dim1.tolist(), collection.dim2.tolist(), areas)
+        table = collection.color_table
+        # Шаблоны берутся из классов фигур, поэтому строки совпадают с их __repr__
+        area_format = Figure.AREA_FORMAT.format
+        for kind, color, dim1, dim2, area in columns:
+            name = KIND_NAMES[kind]
+            if kind == KIND_RECTANGLE:
+                text = Rectangle.TEMPLATE.format(name, table[color], dim1, dim2, area_format(area))
+            elif kind == KIND_CIRCLE:
+                text = Circle.TEMPLATE.format(name, table[color], dim1, area_format(area))
+            else:
+                text = Square.TEMPLATE.format(name, table[color], dim1, area_format(area))
+            yield self._decorate(name, text) if self.use_color else text
+
+    def render(self, figures):
+        """
+        Выводит фигуры (последовательность объектов или FigureCollection).
+
+        Returns:
+            Количество выведенных фигур
+        """
+        if isinstance(figures, FigureCollection):
+            lines = self._collection_lines(figures)
+        else:
+            lines = self._figure_lines(figures)
+
+        count = 0
+        buffer = []
+        for line in lines:
+            buffer.append(line)
+            if len(buffer) >= self.batch_size:
+                self.stream.write("\n".join(buffer) + "\n")
+                count += len(buffer)
+                buffer.clear()
+        if buffer:
+            self.stream.write("\n".join(buffer) + "\n")
+            count += len(buffer)
+
+        self.stream.flush()
+        return count
+
+def render_to_file(figures, path, batch_size=10000):
+    """Записывает описания фигур в текстовый файл (без кодов ANSI)"""
+    with open(path, 'w', encoding='utf-8') as stream:
+        return FigureRenderer(stream, use_color=False, batch_size=batch_size).render(figures)
@@ -0,0 +1,239 @@
+import math
+import heapq
+import numpy as np
+from .collection import KIND_CIRCLE
+
+class GridIndex:
+    """
+    Пространственный индекс по равномерной сетке для коллекции фигур.
+
+    Каждая размещённая фигура хранится в ячейке, где лежит её центр.
+    Фигуры, которые больше ячейки, хранятся отдельным списком и проверяются
+    при каждом запросе, поэтому окно поиска достаточно расширить на одну ячейку.
+    Запросы затрагивают только ячейки рядом с областью поиска,
+    а не всю коллекцию.
+    """
+
+    def __init__(self, collection, cell_size=None):
+        """
+        Args:
+            collection: FigureCollection, по которой строится индекс
+            cell_size: Размер ячейки; по умолчанию подбирается так,
+                       чтобы в ячейке было в среднем несколько фигур
+        """
+        self.collection = collection
+        self.cell_size = cell_size
+        self._cells = {}
+        self._large = set()
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def _default_cell_size(self, x, y, half_x, half_y):
+        """Размер ячейки: около 4 фигур на ячейку, но не меньше типичной фигуры"""
+        if len(x) == 0:
+            return 1.0
+        width = float(x.max() - x.min())
+        height = float(y.max() - y.min())
+        by_density = math.sqrt(max(width * height, 1e-12) * 4 / len(x))
+        by_size = 2 * float(np.median(np.maximum(half_x, half_y)))
+        return max(by_density, by_size, 1e-9)
+
+    def _cell(self, x, y):
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def bulk_load(self):
+        """Строит индекс по всем размещённым фигурам коллекции"""
+        collection = self.collection
+        x, y = collection.x, collection.y
+        half_x, half_y = collection.half_extents()
+        placed = np.flatnonzero(~np.isnan(x))
+
+        if self.cell_size is None:
+            self.cell_size = self._default_cell_size(x[placed], y[placed], half_x[placed], half_y[placed])
+
+        large = np.maximum(half_x[placed], half_y[placed]) > self.cell_size
+        self._large = set(placed[large].tolist())
+        small = placed[~large]
+
+        # Группируем индексы по ячейкам сортировкой, а не циклом по фигурам
+        cell_x = np.floor(x[small] / self.cell_size).astype(np.int64)
+        cell_y = np.floor(y[small] / self.cell_size).astype(np.int64)
+        order = np.lexsort((cell_y, cell_x))
+        cell_x, cell_y, small = cell_x[order], cell_y[order], small[order]
+        bounds = np.flatnonzero((np.diff(cell_x) != 0) | (np.diff(cell_y) != 0)) + 1
+        starts = np.concatenate(([0], bounds)).astype(np.int64)
+        ends = np.concatenate((bounds, [len(small)])).astype(np.int64)
+
+        self._cells = {}
+        if len(small):
+            for start, end, cx, cy in zip(starts.tolist(), ends.tolist(),
+                                          cell_x[starts].tolist(), cell_y[starts].tolist()):
+                self._cells[(cx, cy)] = small[start:end]
+        self._count = len(placed)
+        return self
+
+    def insert(self, index):
+        """Добавляет в индекс фигуру коллекции с заданным индексом"""
+        x, y, half_x, half_y = self._geometry(index)
+        if math.isnan(x):
+            raise ValueError("Фигура не размещена: у неё нет координат")
+        if self.cell_size is None:
+            self.cell_size = max(2 * max(half_x, half_y), 1.0)
+
+        if max(half_x, half_y) > self.cell_size:
+            self._large.add(index)
+        else:
+            cell = self._cell(x, y)
+            items = self._cells.get(cell)
+            self._cells[cell] = np.append(items, index) if items is not None else np.array([index])
+        self._count += 1
+
+    def add(self, figure):
+        """Добавляет фигуру в коллекцию и в индекс; возвращает её индекс"""
+        index = self.collection.append(figure)
+        self.insert(index)
+        return index
+
+    def remove(self, index):
+        """Удаляет фигуру из индекса (в коллекции она остаётся)"""
+        if index in self._large:
+            self._large.discard(index)
+        else:
+            x, y, _, _ = self._geometry(index)
+            cell = self._cell(x, y)
+            items = self._cells.get(cell)
+            if items is None or index not in items:
+                raise KeyError(f"Фигура {index} отсутствует в индексе")
+            items = items[items != index]
+            if len(items):
+                self._cells[cell] = items
+            else:
+                del self._cells[cell]
+        self._count -= 1
+
+    def _geometry(self, index):
+        collection = self.collection
+        kind = collection.kinds[index]
+        half_x, half_y = collection.dim1[index], collection.dim2[index]
+        if kind != KIND_CIRCLE:
+            half_x, half_y = half_x / 2, half_y / 2
+        return float(collection.x[index]), float(collection.y[index]), float(half_x), float(half_y)
+
+    def _candidates(self, xmin, ymin, xmax, ymax):
+        """Индексы фигур, центры которых могут лежать в расширенном окне"""
+        size = self.cell_size
+        if size is None:
+            return np.array([], dtype=np.int64)
+        # Небольшие фигуры не выступают из своей ячейки дальше, чем на размер ячейки
+        cx0, cy0 = self._cell(xmin - size, ymin - size)
+        cx1, cy1 = self._cell(xmax + size, ymax + size)
+
+        parts = []
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > len(self._cells):
+            for (cx, cy), items in self._cells.items():
+                if cx0 <= cx <= cx1 and cy0 <= cy <= cy1:
+                    parts.append(items)
+        else:
+            for cx in range(cx0, cx1 + 1):
+                for cy in range(cy0, cy1 + 1):
+                    items = self._cells.get((cx, cy))
+                    if items is not None:
+                        parts.append(items)
+        if self._large:
+            parts.append(np.fromiter(self._large, dtype=np.int64, count=len(self._large)))
+        if not parts:
+            return np.array([], dtype=np.int64)
+        return np.concatenate(parts)
+
+    def _bounds(self, indices):
+        collection = self.collection
+        x, y = collection.x[indices], collection.y[indices]
+        is_circle = collection.kinds[indices] == KIND_CIRCLE
+        dim1, dim2 = collection.dim1[indices], collection.dim2[indices]
+        half_x = np.where(is_circle, dim1, dim1 / 2)
+        half_y = np.where(is_circle, dim2, dim2 / 2)
+        return x, y, half_x, half_y, is_circle
+
+    def query_bbox(self, xmin, ymin, xmax, ymax):
+        """Индексы фигур, описанный прямоугольник которых пересекает заданный"""
+        candidates = self._candidates(xmin, ymin, xmax, ymax)
+        x, y, half_x, half_y, _ = self._bounds(candidates)
+        mask = (x - half_x <= xmax) & (x + half_x >= xmin) & (y - half_y <= ymax) & (y + half_y >= ymin)
+        return np.sort(candidates[mask])
+
+    def query_point(self, px, py):
+        """Индексы фигур, содержащих точку (px, py)"""
+        candidates = self._candidates(px, py, px, py)
+        x, y, half_x, half_y, is_circle = self._bounds(candidates)
+        dx, dy = px - x, py - y
+        inside = np.where(is_circle,
+                          dx * dx + dy * dy <= half_x * half_x,
+                          (np.abs(dx) <= half_x) & (np.abs(dy) <= half_y))
+        return np.sort(candidates[inside])
+
+    def nearest(self, px, py, k=1):
+        """
+        k фигур, ближайших к точке по расстоянию до центра.
+
+        Ячейки просматриваются кольцами вокруг точки, пока k-е найденное
+        расстояние не станет меньше расстояния до следующего кольца.
+
+        Returns:
+            Массив индексов, упорядоченный по возрастанию расстояния
+        """
+        if k <= 0 or self._count == 0:
+            return np.array([], dtype=np.int64)
+        k = min(k, self._count)
+        collection = self.collection
+        center_x, center_y = self._cell(px, py)
+        best = []  # куча (-расстояние², индекс) из k лучших кандидатов
+        seen = 0
+        total_small = self._count - len(self._large)
+
+        def consider(indices):
+            distances = (collection.x[indices] - px) ** 2 + (collection.y[indices] - py) ** 2
+            for distance, index in zip(distances.tolist(), indices.tolist()):
+                if len(best) < k:
+                    heapq.heappush(best, (-distance, index))
+                elif distance < -best[0][0]:
+                    heapq.heapreplace(best, (-distance, index))
+
+        if self._large:
+            consider(np.fromiter(self._large, dtype=np.int64, count=len(self._large)))
+
+        ring = 0
+        while seen < total_small:
+            if ring > 0 and 8 * ring > len(self._cells):
+                # Кольцо больше числа занятых ячеек - дешевле просмотреть оставшиеся ячейки
+                rest = [items for (cx, cy), items in self._cells.items()
+                        if max(abs(cx - center_x), abs(cy - center_y)) >= ring]
+                if rest:
+                    consider(np.concatenate(rest))
+                break
+
+            for cx in range(center_x - ring, center_x + ring + 1):
+                for cy in range(center_y - ring, center_y + ring + 1):
+                    if max(abs(cx - center_x), abs(cy - center_y)) != ring:
+                        continue
+                    items = self._cells.get((cx, cy))
+                    if items is not None:
+                        consider(items)
+                        seen += len(items)
+
+            # Центры в следующих кольцах не ближе ring * cell_size
+            if len(best) == k and -best[0][0] <= (ring * self.cell_size) ** 2:
+                break
+            ring += 1
+
+        return np.array([index for _, index in sorted(best, key=lambda item: (-item[0], item[1]))],
+                        dtype=np.int64)
+
+    def __repr__(self):
+        return "Сеточный индекс: {} фигур, {} ячеек размером {}, {} крупных фигур".format(
+            self._count,
+            len(self._cells),
+            self.cell_size,
+            len(self._large)
+        )
@@ -3,9 +3,14 @@ from .rectangle import Rectangle
 class Square(Rectangle):
     """Класс Квадрат (наследуется от Прямоугольника)"""
     
-    def __init__(self, side, color):
+    __slots__ = ()
+    
+    # Шаблон описания: название, цвет, сторона, площадь (общий с FigureRenderer)
+    TEMPLATE = "{} {} цвета со стороной {} площадью {}"
+    
+    def __init__(self, side, color, position=None):
         # Вызываем конструктор родительского класса
-        super().__init__(side, side, color)
+        super().__init__(side, side, color, position)
         self._name = "Квадрат"
     
     @property
@@ -13,9 +18,9 @@ class Square(Rectangle):
         return self._name
     
     def __repr__(self):
-        return "{} {} цвета со стороной {} площадью {:.2f}".format(
+        return self.TEMPLATE.format(
             self.name, 
             self.color_property.color, 
-            self.width,  # или self.height, они равны
-            self.area()
+            self._width,  # или self._height, они равны
+            self.area_text()
         )
\ No newline at end of file
@@ -0,0 +1,126 @@
+import os
+import shutil
+import struct
+import tempfile
+import numpy as np
+from .collection import FigureCollection
+
+# Формат файла коллекции фигур:
+#   заголовок (32 байта): сигнатура, версия, число фигур, смещение и размер таблицы цветов;
+#   записи фиксированной длины (RECORD_DTYPE), по одной на фигуру;
+#   таблица цветов: для каждого цвета длина (uint32) и строка в UTF-8;
+#   длина NO_COLOR обозначает цвет None.
+MAGIC = b'FIGC'
+NO_COLOR = 0xFFFFFFFF
+VERSION = 1
+HEADER = struct.Struct('<4sHHQQI4x')
+
+RECORD_DTYPE = np.dtype([
+    ('kind', '<u1'),
+    ('pad', 'V3'),
+    ('color', '<i4'),
+    ('dim1', '<f8'),
+    ('dim2', '<f8'),
+    ('x', '<f8'),
+    ('y', '<f8'),
+])
+
+def save_collection(figures, path, chunk_size=1_000_000):
+    """
+    Сохраняет фигуры в двоичный файл.
+
+    Args:
+        figures: FigureCollection или последовательность объектов фигур
+        path: Путь к файлу
+        chunk_size: Количество записей, преобразуемых за один раз
+
+    Returns:
+        Количество сохранённых фигур
+    """
+    collection = figures if isinstance(figures, FigureCollection) else FigureCollection.from_figures(figures)
+    count = len(collection)
+    colors_offset = HEADER.size + count * RECORD_DTYPE.itemsize
+
+    # Запись идёт во временный файл, который затем заменяет целевой: коллекция
+    # могла быть загружена из этого же файла, и её столбцы отображены на него
+    directory = os.path.dirname(os.path.abspath(path))
+    handle, temp_path = tempfile.mkstemp(prefix='.figc-', dir=directory)
+    try:
+        with os.fdopen(handle, 'wb') as file:
+            _write_collection(file, collection, count, colors_offset, chunk_size)
+        # mkstemp создаёт файл с правами 0600 - восстанавливаем обычные права
+        if os.path.exists(path):
+            shutil.copymode(path, temp_path)
+        else:
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(temp_path, 0o666 & ~umask)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+    return count
+
+def _write_collection(file, collection, count, colors_offset, chunk_size):
+    """Записывает заголовок, записи и таблицу цветов в открытый файл"""
+    file.write(HEADER.pack(MAGIC, VERSION, 0, count, colors_offset, len(collection.color_table)))
+
+    # Записи формируются порциями, чтобы не держать в памяти копию всей коллекции
+    records = np.zeros(min(chunk_size, count), dtype=RECORD_DTYPE)
+    for start in range(0, count, chunk_size):
+        end = min(start + chunk_size, count)
+        chunk = records[:end - start]
+        chunk['kind'] = collection.kinds[start:end]
+        chunk['color'] = collection.colors[start:end]
+        chunk['dim1'] = collection.dim1[start:end]
+        chunk['dim2'] = collection.dim2[start:end]
+        chunk['x'] = collection.x[start:end]
+        chunk['y'] = collection.y[start:end]
+        file.write(chunk.tobytes())
+
+    for color in collection.color_table:
+        if color is None:
+            file.write(struct.pack('<I', NO_COLOR))
+            continue
+        encoded = str(color).encode('utf-8')
+        file.write(struct.pack('<I', len(encoded)))
+        file.write(encoded)
+
+def load_collection(path):
+    """
+    Открывает файл коллекции через отображение в память.
+
+    Данные не считываются целиком: столбцы коллекции - представления
+    отображённого файла, поэтому открытие занимает миллисекунды,
+    а при итерации или срезе читаются только нужные записи.
+    Добавление фигур в такую коллекцию копирует её в память.
+    """
+    with open(path, 'rb') as file:
+        header = file.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise ValueError(f"Файл {path} слишком короткий для коллекции фигур")
+        magic, version, _, count, colors_offset, colors_count = HEADER.unpack(header)
+        if magic != MAGIC:
+            raise ValueError(f"Файл {path} не является коллекцией фигур")
+        if version != VERSION:
+            raise ValueError(f"Неподдерживаемая версия формата: {version}")
+
+        file.seek(colors_offset)
+        color_table = []
+        for _ in range(colors_count):
+            (length,) = struct.unpack('<I', file.read(4))
+            if length == NO_COLOR:
+                color_table.append(None)
+            else:
+                color_table.append(file.read(length).decode('utf-8'))
+
+    if count:
+        records = np.memmap(path, dtype=RECORD_DTYPE, mode='r', offset=HEADER.size, shape=(count,))
+    else:
+        records = np.zeros(0, dtype=RECORD_DTYPE)
+
+    return FigureCollection.from_arrays(
+        records['kind'], records['dim1'], records['dim2'], records['color'],
+        color_table, records['x'], records['y'],
+    )
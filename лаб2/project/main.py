@@ -1,6 +1,7 @@
 from lab_python_oop.rectangle import Rectangle
 from lab_python_oop.circle import Circle
 from lab_python_oop.square import Square
+from lab_python_oop.render import FigureRenderer
 
 # Импорт внешнего пакета (colorama для цветного вывода)
 try:
@@ -25,11 +26,12 @@ def main():
     circle = Circle(radius=N, color="зеленого")
     square = Square(side=N, color="красного")
     
-    # Вывод информации о фигурах
+    figures = [rectangle, circle, square]
+    
+    # Вывод информации о фигурах (цвета ANSI - только при выводе в терминал)
     if COLORAMA_AVAILABLE:
-        print(Fore.BLUE + str(rectangle))
-        print(Fore.GREEN + str(circle))
-        print(Fore.RED + str(square))
+        styles = {rectangle.name: Fore.BLUE, circle.name: Fore.GREEN, square.name: Fore.RED}
+        FigureRenderer(styles=styles).render(figures)
         
         # Демонстрация работы внешнего пакета
         print("\n" + "=" * 50)
@@ -39,9 +41,7 @@ def main():
         print(Style.RESET_ALL + "Текст сброшен к стандартному формату")
     else:
         # Вывод без цветов, если colorama не установлен
-        print(rectangle)
-        print(circle)
-        print(square)
+        FigureRenderer().render(figures)
         print("\n" + "=" * 50)
         print("Colorama не установлен. Для цветного вывода установите: pip install colorama")
     
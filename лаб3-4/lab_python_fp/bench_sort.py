@@ -0,0 +1,38 @@
+"""
+Масштабирование параллельной сортировки по числу процессов
+
+Запуск: python bench_sort.py [размер списка] [максимальное число процессов]
+"""
+import os
+import sys
+import time
+import random
+from sort import sort, parallel_sort
+
+def record_key(record):
+    """Ключ записи; функция модульного уровня, чтобы её можно было передать процессам"""
+    return record[1].lower()
+
+def measure(function, *args, **kwargs):
+    """Время выполнения функции в секундах"""
+    start_time = time.perf_counter()
+    function(*args, **kwargs)
+    return time.perf_counter() - start_time
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+    
+    data = [(index, f"Name{random.random()}") for index in range(size)]
+    print(f"Размер списка: {size}, ядер: {os.cpu_count()}")
+    print("=" * 50)
+    
+    baseline = measure(sort, data, key=record_key)
+    print(f"Процессов: 1, время: {baseline:.3f} с")
+    
+    for workers in range(2, max_workers + 1):
+        elapsed = measure(parallel_sort, data, key=record_key, workers=workers)
+        print(f"Процессов: {workers}, время: {elapsed:.3f} с, ускорение: {baseline / elapsed:.2f}x")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,227 @@
+"""
+Набор тестов производительности утилит lab_python_fp
+
+Каждая утилита измеряется на нескольких размерах входных данных и видах
+данных, для утилит с двумя реализациями (функция и класс) - обе версии.
+Результаты выводятся таблицей и сохраняются в JSON; при указании базового
+файла результаты сравниваются с ним, а замедление больше порога
+считается регрессией (код возврата 1).
+
+Запуск:
+    python benchmark.py --sizes 1000,100000 --output results.json
+    python benchmark.py --baseline results.json --threshold 0.2
+    python benchmark.py --only sort,unique --sizes 10000000
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import statistics
+from contextlib import redirect_stdout
+from itertools import islice
+from unique import Unique, unique
+from sort import sort, sort_by, top_k
+from field import field, field_columns
+from gen_random import gen_random, gen_random_array, NUMPY_AVAILABLE
+from process_data import f1, f2, f3, f4, run_lazy
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+
+NAMES = ['Анна', 'андрей', 'Алексей', 'Мария', 'ольга', 'Ivan', 'Ksenia', 'alexey']
+
+def make_data(shape, size, seed):
+    """
+    Входные данные заданного вида; при одинаковом seed - одинаковые
+    
+    Виды: random - случайные числа, sorted / reversed - упорядоченные,
+    duplicates - около 100 различных значений, strings - имена в разном
+    регистре, records - записи с несколькими полями, wide - записи
+    с 50 полями.
+    """
+    generator = random.Random(f"{seed}:{shape}:{size}")
+    if shape == 'random':
+        return [generator.randrange(size * 10) for _ in range(size)]
+    if shape == 'sorted':
+        return list(range(size))
+    if shape == 'reversed':
+        return list(range(size, 0, -1))
+    if shape == 'duplicates':
+        return [generator.randrange(100) for _ in range(size)]
+    if shape == 'strings':
+        return [generator.choice(NAMES) + str(generator.randrange(max(1, size // 10))) for _ in range(size)]
+    if shape == 'records':
+        return [{'name': generator.choice(NAMES) + str(generator.randrange(max(1, size // 10))),
+                 'age': generator.randrange(18, 70), 'salary': generator.randrange(30000, 200000)}
+                for _ in range(size)]
+    if shape == 'wide':
+        return [{f"field{column}": generator.random() for column in range(50)} for _ in range(size)]
+    raise ValueError(f"Неизвестный вид данных: {shape}")
+
+def _quiet(function):
+    """Обёртка, подавляющая вывод декоратора print_result"""
+    def wrapper(*args):
+        with open(os.devnull, 'w', encoding='utf-8') as devnull, redirect_stdout(devnull):
+            return function(*args)
+    return wrapper
+
+def _eager_pipeline(data):
+    return f4(f3(f2(f1(data))))
+
+# (утилита, вариант, виды данных, функция от входных данных)
+CASES = [
+    ('unique', 'Unique', ('random', 'duplicates', 'strings'), lambda data: list(Unique(data))),
+    ('unique', 'Unique ignore_case', ('strings',), lambda data: list(Unique(data, ignore_case=True))),
+    ('unique', 'Unique generator', ('random', 'duplicates'), lambda data: list(Unique(iter(data)))),
+    ('unique', 'unique class', ('random', 'duplicates', 'strings'), lambda data: list(unique(data))),
+    ('sort', 'sort', ('random', 'sorted', 'reversed', 'duplicates', 'strings'), lambda data: sort(data)),
+    ('sort', 'sort key=abs reverse', ('random',), lambda data: sort(data, key=abs, reverse=True)),
+    ('sort', 'sort_by class', ('random', 'sorted', 'reversed', 'strings'), lambda data: list(sort_by(data))),
+    ('sort', 'sort_by lazy first 10', ('random',), lambda data: list(islice(sort_by(data, lazy=True), 10))),
+    ('sort', 'top_k 10', ('random',), lambda data: top_k(data, 10)),
+    ('sort', 'sort_by external', ('random',),
+     lambda data: sum(1 for _ in sort_by(data, run_size=max(1000, len(data) // 8)))),
+    ('field', 'field one', ('records',), lambda data: list(field(data, 'name'))),
+    ('field', 'field many', ('records', 'wide'), lambda data: list(field(data, 'name', 'age', 'field0', 'field1'))),
+    ('field', 'field_columns', ('records', 'wide'), lambda data: field_columns(data, 'name', 'age', 'field0', 'field1')),
+    ('gen_random', 'gen_random', ('size',), lambda size: gen_random(size, 1, 100)),
+    ('process_data', 'f1-f4', ('records',), _quiet(_eager_pipeline)),
+    ('process_data', 'lazy', ('records',), lambda data: run_lazy(data, sample=0)),
+]
+
+if NUMPY_AVAILABLE:
+    CASES.append(('gen_random', 'gen_random_array', ('size',), lambda size: gen_random_array(size, 1, 100, seed=0)))
+
+def measure(function, data, repeat):
+    """Время каждого из repeat запусков в секундах (после одного прогревочного запуска)"""
+    function(data)
+    times = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        function(data)
+        times.append(time.perf_counter() - start_time)
+    return times
+
+def run(sizes, repeat, only=None, seed=0, stream=None):
+    """
+    Выполняет все случаи и возвращает список результатов
+    
+    Args:
+        sizes: Размеры входных данных
+        repeat: Количество запусков каждого случая
+        only: Названия утилит, которые нужно измерить (None - все)
+        seed: Зерно генерации входных данных
+    """
+    stream = stream if stream is not None else sys.stdout
+    results = []
+    for size in sizes:
+        cache = {}
+        for benchmark, variant, shapes, function in CASES:
+            if only and benchmark not in only:
+                continue
+            for shape in shapes:
+                if shape == 'size':
+                    data = size
+                else:
+                    if shape not in cache:
+                        cache[shape] = make_data(shape, size, seed)
+                    data = cache[shape]
+                times = measure(function, data, repeat)
+                row = {
+                    'benchmark': benchmark,
+                    'variant': variant,
+                    'shape': shape,
+                    'size': size,
+                    'min_s': min(times),
+                    'median_s': statistics.median(times),
+                    'items_per_s': size / min(times) if min(times) else None,
+                }
+                results.append(row)
+                print("{:<14}{:<24}{:<12}{:>10}{:>12.4f}{:>12.4f}".format(
+                    benchmark, variant, shape, size, row['min_s'], row['median_s']), file=stream)
+        cache.clear()
+    return results
+
+def _row_key(row):
+    return row['benchmark'], row['variant'], row['shape'], row['size']
+
+def compare(results, baseline, threshold, stream=None):
+    """
+    Сравнивает результаты с базовыми по минимальному времени
+    
+    Returns:
+        Список регрессий: (случай, базовое время, текущее время, отношение)
+    """
+    stream = stream if stream is not None else sys.stdout
+    base = {_row_key(row): row for row in baseline['results']}
+    regressions = []
+    print("\nСравнение с базовыми результатами (отношение > 1 - медленнее):", file=stream)
+    for row in results:
+        previous = base.get(_row_key(row))
+        if previous is None or not previous['min_s']:
+            continue
+        ratio = row['min_s'] / previous['min_s']
+        mark = "  РЕГРЕССИЯ" if ratio > 1 + threshold else ""
+        print("{:<14}{:<24}{:<12}{:>10}{:>10.2f}x{}".format(*_row_key(row), ratio, mark), file=stream)
+        if mark:
+            regressions.append((_row_key(row), previous['min_s'], row['min_s'], ratio))
+    return regressions
+
+def environment():
+    """Сведения об окружении, сохраняемые вместе с результатами"""
+    info = {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+    if NUMPY_AVAILABLE:
+        import numpy
+        info['numpy'] = numpy.__version__
+    return info
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Тесты производительности lab_python_fp")
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+                        help="Размеры входных данных через запятую (до 10000000)")
+    parser.add_argument('--repeat', type=int, default=3, help="Количество запусков каждого случая")
+    parser.add_argument('--only', help="Утилиты через запятую: "
+                        + ", ".join(sorted({case[0] for case in CASES})))
+    parser.add_argument('--seed', type=int, default=0, help="Зерно генерации входных данных")
+    parser.add_argument('--output', help="Файл JSON для результатов")
+    parser.add_argument('--baseline', help="Файл JSON с базовыми результатами для сравнения")
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help="Допустимое замедление относительно базовых результатов (0.2 = 20%%)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(',')]
+    only = set(args.only.split(',')) if args.only else None
+    
+    print("{:<14}{:<24}{:<12}{:>10}{:>12}{:>12}".format(
+        "Утилита", "Вариант", "Данные", "Размер", "Мин., с", "Медиана, с"))
+    print("=" * 84)
+    results = run(sizes, args.repeat, only, args.seed)
+    
+    report = {'environment': environment(), 'repeat': args.repeat, 'seed': args.seed, 'results': results}
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, ensure_ascii=False, indent=2)
+        print(f"\nРезультаты сохранены в {args.output}")
+    
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as file:
+            baseline = json.load(file)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\nРегрессий: {len(regressions)} (порог {args.threshold:.0%})")
+            return 1
+        print("\nРегрессий нет")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
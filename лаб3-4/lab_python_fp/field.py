@@ -1,5 +1,12 @@
+from itertools import repeat
 from typing import List, Dict, Any, Union
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 def field(items: List[Dict], *args: str) -> Union[List, List[Dict]]:
     """
     Генератор для выборки полей из словарей
@@ -15,21 +22,64 @@ def field(items: List[Dict], *args: str) -> Union[List, List[Dict]]:
     if len(args) == 0:
         return
     
+    if len(args) == 1:
+        field_name = args[0]
+        for item in items:
+            if isinstance(item, dict):
+                # Один поиск по ключу вместо проверки "in" и индексации
+                value = item.get(field_name)
+                if value is not None:
+                    yield value
+        return
+    
     for item in items:
         if not isinstance(item, dict):
             continue
-            
-        if len(args) == 1:
-            field_name = args[0]
-            if field_name in item and item[field_name] is not None:
-                yield item[field_name]
-        else:
-            result = {}
-            has_valid_fields = False
-            for field_name in args:
-                if field_name in item and item[field_name] is not None:
-                    result[field_name] = item[field_name]
-                    has_valid_fields = True
-            
-            if has_valid_fields:
-                yield result
\ No newline at end of file
+        
+        result = {}
+        get = item.get
+        for field_name in args:
+            value = get(field_name)
+            if value is not None:
+                result[field_name] = value
+        
+        if result:
+            yield result
+
+def field_columns(items: List[Dict], *args: str, as_numpy: bool = False,
+                  fill_value: Any = None) -> Dict[str, Any]:
+    """
+    Выборка полей из словарей по столбцам
+    
+    В отличие от field(), значения не собираются в словарь для каждой записи:
+    каждое поле возвращается отдельным столбцом, и i-е значения всех столбцов
+    относятся к одной и той же записи. Входные данные читаются один раз,
+    а столбцы заполняются на уровне C (map с dict.get).
+    
+    Args:
+        items: Итерируемые словари (остальные элементы пропускаются)
+        *args: Названия полей
+        as_numpy: Вернуть столбцы массивами NumPy вместо списков
+        fill_value: Значение для отсутствующих полей и None
+                    (например, float('nan') для числовых массивов)
+    
+    Returns:
+        Словарь {название поля: столбец значений}
+    """
+    if as_numpy and not NUMPY_AVAILABLE:
+        raise ImportError("Для as_numpy=True требуется библиотека numpy")
+    
+    rows = [item for item in items if isinstance(item, dict)]
+    columns = {}
+    for field_name in args:
+        column = list(map(dict.get, rows, repeat(field_name)))
+        if fill_value is not None:
+            column = [fill_value if value is None else value for value in column]
+        columns[field_name] = column
+    
+    if as_numpy:
+        for field_name, column in columns.items():
+            # Столбец с пропусками (None) остаётся массивом объектов
+            dtype = object if None in column else None
+            columns[field_name] = np.array(column, dtype=dtype)
+    return columns
\ No newline at end of file
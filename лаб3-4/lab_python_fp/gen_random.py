@@ -1,5 +1,14 @@
 import random
-from typing import List
+from typing import Any, Iterator, List
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Размер порции по умолчанию для потоковой генерации
+CHUNK_SIZE = 1_000_000
 
 def gen_random(num_count: int, min_value: int, max_value: int) -> List[int]:
     """
@@ -21,4 +30,65 @@ def gen_random_generator(num_count: int, min_value: int, max_value: int):
     Генератор случайных чисел (реализация как генератор)
     """
     for _ in range(num_count):
-        yield random.randint(min_value, max_value)
\ No newline at end of file
+        yield random.randint(min_value, max_value)
+
+def _make_rng(seed: Any = None):
+    """Генератор NumPy из seed (число, SeedSequence или готовый Generator)"""
+    if isinstance(seed, np.random.Generator):
+        return seed
+    return np.random.default_rng(seed)
+
+def gen_random_array(num_count: int, min_value: int, max_value: int, seed: Any = None) -> Any:
+    """
+    Случайные числа одним массивом NumPy (границы включаются, как в randint)
+    
+    10^8 чисел генерируются за секунды вместо минут для списка.
+    Без NumPy возвращается список, заполненный random.Random(seed).
+    
+    Args:
+        num_count: Количество чисел
+        min_value: Минимальное значение
+        max_value: Максимальное значение
+        seed: Зерно, SeedSequence или np.random.Generator - для воспроизводимости
+    
+    Returns:
+        Массив int64 (или список без NumPy)
+    """
+    if not NUMPY_AVAILABLE:
+        generator = seed if isinstance(seed, random.Random) else random.Random(seed)
+        return [generator.randint(min_value, max_value) for _ in range(num_count)]
+    return _make_rng(seed).integers(min_value, max_value, size=num_count, endpoint=True)
+
+def gen_random_chunks(num_count: int, min_value: int, max_value: int, seed: Any = None,
+                      chunk_size: int = CHUNK_SIZE) -> Iterator[Any]:
+    """
+    Потоковая генерация: порции по chunk_size чисел
+    
+    В памяти находится одна порция, поэтому количество чисел не ограничено
+    памятью. При одинаковом seed последовательность не зависит от chunk_size.
+    
+    Yields:
+        Массивы NumPy (или списки без NumPy)
+    """
+    if chunk_size <= 0:
+        raise ValueError("Размер порции должен быть положительным")
+    generator = _make_rng(seed) if NUMPY_AVAILABLE else random.Random(seed)
+    for start in range(0, num_count, chunk_size):
+        yield gen_random_array(min(chunk_size, num_count - start), min_value, max_value, generator)
+
+def spawn_generators(count: int, seed: Any = None) -> List[Any]:
+    """
+    Независимые генераторы для параллельных процессов
+    
+    Генераторы получены из одного SeedSequence через spawn, поэтому
+    их последовательности статистически независимы, а весь набор
+    воспроизводим по seed. Генератор можно передать процессу
+    и использовать как seed в gen_random_array/gen_random_chunks.
+    
+    Args:
+        count: Количество генераторов
+        seed: Общее зерно (None - из энтропии ОС)
+    """
+    if not NUMPY_AVAILABLE:
+        raise ImportError("Для spawn_generators требуется библиотека numpy")
+    return [np.random.default_rng(child) for child in np.random.SeedSequence(seed).spawn(count)]
\ No newline at end of file
@@ -0,0 +1,175 @@
+import os
+import sys
+import json
+import time
+import codecs
+from typing import Any, Callable, Iterator
+
+# Размер порции, читаемой из файла за один раз (в байтах)
+CHUNK_SIZE = 1 << 20
+
+# Символы, которыми может продолжаться число JSON
+_NUMBER_TAIL = frozenset('0123456789.eE+-')
+
+class Progress:
+    """
+    Вывод прогресса чтения файла не чаще одного раза в interval секунд
+    """
+    
+    def __init__(self, total_bytes: int = None, interval: float = 1.0, stream=None):
+        self.total_bytes = total_bytes
+        self.interval = interval
+        self.stream = stream if stream is not None else sys.stderr
+        self.started = time.monotonic()
+        self.last_report = self.started
+    
+    def __call__(self, bytes_read: int, records: int, final: bool = False):
+        now = time.monotonic()
+        if not final and now - self.last_report < self.interval:
+            return
+        self.last_report = now
+        
+        elapsed = now - self.started
+        text = f"Прочитано {bytes_read / 2**20:.1f} МБ"
+        if self.total_bytes:
+            text += f" из {self.total_bytes / 2**20:.1f} МБ ({bytes_read / self.total_bytes:.0%})"
+        text += f", записей: {records}"
+        if elapsed > 0:
+            text += f", {records / elapsed:.0f} записей/с"
+        print(text, file=self.stream)
+
+def iter_ndjson(file, progress: Callable = None) -> Iterator[Any]:
+    """
+    Записи файла NDJSON (по одному JSON-значению в строке)
+    
+    Args:
+        file: Файл, открытый в двоичном режиме
+        progress: Функция progress(прочитано байт, записей), вызывается после каждой записи
+    """
+    bytes_read = 0
+    records = 0
+    for number, line in enumerate(file, 1):
+        bytes_read += len(line)
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as error:
+            raise json.JSONDecodeError(f"Строка {number}: {error.msg}", error.doc, error.pos) from None
+        records += 1
+        if progress:
+            progress(bytes_read, records)
+        yield record
+    if progress:
+        progress(bytes_read, records, final=True)
+
+def iter_json_array(file, chunk_size: int = CHUNK_SIZE, progress: Callable = None) -> Iterator[Any]:
+    """
+    Элементы JSON-массива верхнего уровня без загрузки всего файла
+    
+    Файл читается порциями по chunk_size байт; в памяти находятся
+    только текущая порция и ещё не разобранный хвост предыдущей.
+    
+    Args:
+        file: Файл, открытый в двоичном режиме
+        chunk_size: Размер порции в байтах
+        progress: Функция progress(прочитано байт, записей)
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder('utf-8')()
+    buffer = ''
+    position = 0
+    bytes_read = 0
+    records = 0
+    eof = False
+    started = False
+    # После элемента массива ожидается ',' или ']'
+    after_value = False
+    
+    def read_more():
+        nonlocal buffer, position, bytes_read, eof
+        chunk = file.read(chunk_size)
+        bytes_read += len(chunk)
+        eof = not chunk
+        buffer = buffer[position:] + text_decoder.decode(chunk, final=eof)
+        position = 0
+    
+    while True:
+        # Пропуск пробелов между элементами
+        while True:
+            while position < len(buffer) and buffer[position] in ' \t\r\n':
+                position += 1
+            if position < len(buffer) or eof:
+                break
+            read_more()
+        
+        if position == len(buffer):
+            raise json.JSONDecodeError("Неожиданный конец файла", buffer, position)
+        
+        if not started:
+            if buffer[position] != '[':
+                raise json.JSONDecodeError("Ожидался JSON-массив", buffer, position)
+            started = True
+            position += 1
+            continue
+        
+        if buffer[position] == ']' and (after_value or not records):
+            if progress:
+                progress(bytes_read, records, final=True)
+            return
+        
+        if after_value:
+            if buffer[position] != ',':
+                raise json.JSONDecodeError("Ожидалась ',' или ']'", buffer, position)
+            position += 1
+            after_value = False
+            continue
+        
+        try:
+            record, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            read_more()
+            continue
+        if not eof and (end == len(buffer) or buffer[end] in _NUMBER_TAIL):
+            # Значение могло оборваться на границе порции: число "1.5e3",
+            # разрезанное после "1.5", разбирается как 1.5 - дочитываем
+            read_more()
+            continue
+        
+        position = end
+        after_value = True
+        records += 1
+        if progress:
+            progress(bytes_read, records)
+        yield record
+
+def iter_records(path: str, chunk_size: int = CHUNK_SIZE, progress: Any = False) -> Iterator[Any]:
+    """
+    Потоковое чтение записей из файла JSON-массива или NDJSON
+    
+    Формат определяется по первому значащему символу: '[' - JSON-массив,
+    иначе - NDJSON. Файл открывается сразу (ошибка отсутствия файла
+    возникает при вызове), записи читаются по мере обхода.
+    
+    Args:
+        path: Путь к файлу
+        chunk_size: Размер порции чтения JSON-массива в байтах
+        progress: True - выводить прогресс в stderr, функция - вызывать её
+    """
+    file = open(path, 'rb')
+    if progress is True:
+        progress = Progress(os.path.getsize(path))
+    return _iter_file_records(file, chunk_size, progress or None)
+
+def _iter_file_records(file, chunk_size: int, progress: Callable) -> Iterator[Any]:
+    with file:
+        head = file.read(chunk_size)
+        # Первый символ после пробелов и BOM определяет формат
+        is_array = head.lstrip(b' \t\r\n\xef\xbb\xbf').startswith(b'[')
+        file.seek(3 if head.startswith(codecs.BOM_UTF8) else 0)
+        if is_array:
+            yield from iter_json_array(file, chunk_size, progress)
+        else:
+            yield from iter_ndjson(file, progress)
\ No newline at end of file
@@ -1,34 +1,189 @@
 from functools import wraps
+from itertools import islice
+import atexit
 import inspect
+import queue
+import sys
+import threading
 
-def print_result(func):
+class BufferedSink:
+    """
+    Буферизованный вывод: текст накапливается и записывается в поток
+    одной операцией, когда буфер превышает buffer_size символов
+    (и при завершении программы)
+    """
+    
+    def __init__(self, stream=None, buffer_size=65536):
+        self.stream = stream
+        self.buffer_size = buffer_size
+        self.parts = []
+        self.size = 0
+        self.lock = threading.Lock()
+        atexit.register(self.flush)
+    
+    def write(self, text):
+        with self.lock:
+            self.parts.append(text)
+            self.size += len(text)
+            if self.size < self.buffer_size:
+                return
+            text, self.parts, self.size = ''.join(self.parts), [], 0
+        self._write(text)
+    
+    def _write(self, text):
+        stream = self.stream if self.stream is not None else sys.stdout
+        stream.write(text)
+    
+    def flush(self):
+        with self.lock:
+            text, self.parts, self.size = ''.join(self.parts), [], 0
+        if text:
+            self._write(text)
+
+class BackgroundSink:
+    """
+    Вывод в фоновом потоке: вызывающий код только кладёт готовый текст
+    в очередь, запись в поток (медленный терминал, файл) выполняет
+    отдельный поток. flush() дожидается записи всего накопленного.
+    """
+    
+    def __init__(self, stream=None):
+        self.stream = stream
+        self.queue = queue.Queue()
+        # Ошибка записи в фоновом потоке, ещё не переданная вызывающему коду
+        self.error = None
+        self.thread = threading.Thread(target=self._run, name='print_result', daemon=True)
+        self.thread.start()
+        atexit.register(self.flush)
+    
+    def _run(self):
+        while True:
+            text = self.queue.get()
+            # Всё, что успело накопиться, записывается одной операцией
+            parts = [text]
+            while True:
+                try:
+                    parts.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            stream = self.stream if self.stream is not None else sys.stdout
+            try:
+                stream.write(''.join(parts))
+                stream.flush()
+            except Exception as error:
+                # Поток вывода закрыт или недоступен: ошибка передаётся
+                # вызывающему коду при следующем write/flush
+                self.error = error
+            finally:
+                # Иначе flush() (в том числе при выходе) ждал бы вечно
+                for _ in parts:
+                    self.queue.task_done()
+    
+    def _raise_error(self):
+        error, self.error = self.error, None
+        if error is not None:
+            raise error
+    
+    def write(self, text):
+        self._raise_error()
+        self.queue.put(text)
+    
+    def flush(self):
+        self.queue.join()
+        self._raise_error()
+
+class _StdoutSink:
+    """Синхронная запись в текущий sys.stdout (по умолчанию)"""
+    
+    def write(self, text):
+        sys.stdout.write(text)
+
+def _format_value(value, max_chars):
+    text = str(value)
+    if max_chars is not None and len(text) > max_chars:
+        return text[:max_chars] + '...'
+    return text
+
+def _format_result(result, max_items=None, max_chars=None):
+    """Текст блока "Результат:" - одна строка на элемент, не более max_items элементов"""
+    lines = ["Результат:"]
+    if isinstance(result, (list, tuple, set, dict)):
+        if isinstance(result, dict):
+            items = (f"{key}: {_format_value(value, max_chars)}" for key, value in result.items())
+        else:
+            items = (_format_value(item, max_chars) for item in result)
+        if max_items is not None:
+            items = islice(items, max_items)
+        lines.extend(f"  {item}" for item in items)
+        if max_items is not None and len(result) > max_items:
+            lines.append(f"  ... ещё {len(result) - max_items} элементов")
+    else:
+        lines.append(f"  {_format_value(result, max_chars)}")
+    return "\n".join(lines) + "\n"
+
+def print_result(func=None, *, every=1, max_items=None, max_chars=None, sink=None):
     """
     Декоратор для вывода результата функции
     
     Выводит название функции и её результат в отформатированном виде
+    
+    Можно использовать без параметров (@print_result) или с параметрами:
+    @print_result(every=100, max_items=5, sink=BackgroundSink())
+    
+    Args:
+        every: Выводить каждый every-й вызов (первый вызов выводится всегда)
+        max_items: Сколько элементов результата выводить
+        max_chars: Максимальная длина вывода одного элемента
+        sink: Объект с методом write (BufferedSink, BackgroundSink, файл);
+              по умолчанию - sys.stdout
     """
+    if func is None:
+        return lambda function: print_result(function, every=every, max_items=max_items,
+                                             max_chars=max_chars, sink=sink)
+    
+    output = sink if sink is not None else _StdoutSink()
+    # Сигнатура вычисляется один раз при декорировании, а не при каждом вызове
+    sig = inspect.signature(func)
+    calls = 0
+    
     @wraps(func)
     def wrapper(*args, **kwargs):
-        print(f"\nНазвание функции: {func.__name__}")
+        nonlocal calls
+        calls += 1
+        if every > 1 and calls % every != 1:
+            return func(*args, **kwargs)
         
-        # Получаем сигнатуру функции для красивого вывода аргументов
-        sig = inspect.signature(func)
+        # Получаем аргументы функции для красивого вывода
         bound_args = sig.bind(*args, **kwargs)
         bound_args.apply_defaults()
-        
-        print("Аргументы:", dict(bound_args.arguments))
+        arguments = {name: _format_value(value, max_chars) if max_chars is not None else value
+                     for name, value in bound_args.arguments.items()}
+        output.write(f"\nНазвание функции: {func.__name__}\nАргументы: {arguments}\n")
         
         result = func(*args, **kwargs)
         
-        print("Результат:")
-        if isinstance(result, (list, tuple, set)):
-            for item in result:
-                print(f"  {item}")
-        elif isinstance(result, dict):
-            for key, value in result.items():
-                print(f"  {key}: {value}")
-        else:
-            print(f"  {result}")
-        
+        output.write(_format_result(result, max_items, max_chars))
         return result
-    return wrapper
\ No newline at end of file
+    return wrapper
+
+def print_sample(items, title, limit=10):
+    """
+    Выводит первые limit элементов потока и передаёт поток дальше без изменений
+    
+    Замена print_result для ленивого пайплайна: результат стадии не
+    собирается в список. Стадии выполняются поочерёдно, поэтому строки
+    разных стадий перемежаются и помечаются названием стадии.
+    При limit=0 ничего не выводится.
+    """
+    if limit <= 0:
+        yield from items
+        return
+    
+    iterator = iter(items)
+    for item in islice(iterator, limit):
+        if isinstance(item, tuple) and len(item) == 2:
+            print(f"[{title}] {item[0]}: {item[1]}")
+        else:
+            print(f"[{title}] {item}")
+        yield item
+    yield from iterator
\ No newline at end of file
@@ -1,9 +1,22 @@
-from print_result import print_result
+from print_result import print_result, print_sample
 from field import field
 from gen_random import gen_random
-from cm_timer import cm_timer_1
+from sort import sort_by
+from cm_timer import cm_timer_1, profiler, timed
+from json_stream import iter_records
+from sharded import run_sharded
+from itertools import islice
+import argparse
 import json
-import sys
+
+# Количество имён в одной серии внешней сортировки ленивого пайплайна
+LAZY_RUN_SIZE = 100_000
+
+# Количество имён, для которых зарплаты генерируются одним вызовом gen_random
+SALARY_BATCH = 4096
+
+# Сколько отдельных замеров сохранять в Chrome trace при --profile
+TRACE_EVENTS = 100_000
 
 # Пример данных по умолчанию
 DEFAULT_DATA = [
@@ -16,50 +29,166 @@ DEFAULT_DATA = [
     {'name': 'Andrey', 'age': 32, 'city': 'St Petersburg', 'salary': 65000}
 ]
 
+@timed()
 @print_result
 def f1(arg):
-    """Получить уникальные имена, отсортированные по алфавиту"""
+    """Получить уникальные имена, отсортированные по алфавиту (arg - любые итерируемые записи)"""
     return sorted(list(set(field(arg, 'name'))), key=lambda x: x.lower())
 
+@timed()
 @print_result
 def f2(arg):
     """Отфильтровать имена, начинающиеся на 'А' или 'A'"""
     return list(filter(lambda x: x.lower().startswith('а'), arg))
 
+@timed()
 @print_result
 def f3(arg):
     """Добавить фразу к каждому имени"""
     return list(map(lambda x: x + " смотрит в будущее", arg))
 
+@timed()
 @print_result
 def f4(arg):
     """Сопоставить имена со случайными зарплатами"""
-    return dict(zip(arg, gen_random(len(arg), 100000, 200000)))
+    names = arg if isinstance(arg, (list, tuple)) else list(arg)
+    return dict(zip(names, gen_random(len(names), 100000, 200000)))
+
+# Ленивый пайплайн: стадии - генераторы, в памяти одновременно находится
+# одна серия внешней сортировки f1 и одна порция зарплат f4
+
+def _name_key(name):
+    # Имена, равные без учёта регистра, упорядочиваются между собой,
+    # поэтому одинаковые имена после сортировки идут подряд
+    return name.lower(), name
+
+def f1_lazy(arg, run_size=LAZY_RUN_SIZE, temp_dir=None):
+    """Уникальные имена по алфавиту: внешняя сортировка и пропуск соседних повторов"""
+    previous = None
+    for name in sort_by(field(arg, 'name'), key=_name_key, run_size=run_size, temp_dir=temp_dir):
+        if name != previous:
+            previous = name
+            yield name
+
+def f2_lazy(arg):
+    """Имена, начинающиеся на 'А' или 'A' (генератор)"""
+    return filter(lambda x: x.lower().startswith('а'), arg)
+
+def f3_lazy(arg):
+    """Добавить фразу к каждому имени (генератор)"""
+    return map(lambda x: x + " смотрит в будущее", arg)
+
+def f4_lazy(arg):
+    """Пары (имя, случайная зарплата); зарплаты генерируются порциями"""
+    iterator = iter(arg)
+    while True:
+        names = list(islice(iterator, SALARY_BATCH))
+        if not names:
+            return
+        yield from zip(names, gen_random(len(names), 100000, 200000))
 
-def main():
+def run_lazy(data, sample=10, output=None, run_size=LAZY_RUN_SIZE):
+    """
+    Выполняет пайплайн f1-f4 лениво
+    
+    Args:
+        data: Итерируемые записи
+        sample: Сколько первых результатов каждой стадии выводить (0 - не выводить)
+        output: Файл для записи результата ("имя: зарплата" построчно)
+        run_size: Размер серии внешней сортировки имён
+    
+    Returns:
+        Количество пар (имя, зарплата)
+    """
+    stream = print_sample(f1_lazy(data, run_size), 'f1', sample)
+    stream = print_sample(f2_lazy(stream), 'f2', sample)
+    stream = print_sample(f3_lazy(stream), 'f3', sample)
+    stream = print_sample(f4_lazy(stream), 'f4', sample)
+    
+    count = 0
+    if output is None:
+        for count, _ in enumerate(stream, 1):
+            pass
+        return count
+    
+    with open(output, 'w', encoding='utf-8') as file:
+        for name, salary in stream:
+            file.write(f"{name}: {salary}\n")
+            count += 1
+    return count
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Пайплайн обработки имён f1-f4")
+    parser.add_argument('file', nargs='?', help="Файл с записями (JSON-массив или NDJSON)")
+    parser.add_argument('--lazy', action='store_true',
+                        help="Ленивый режим: стадии - генераторы, память не зависит от числа имён")
+    parser.add_argument('--sample', type=int, default=10,
+                        help="Ленивый режим: сколько результатов каждой стадии выводить (0 - не выводить)")
+    parser.add_argument('--output', help="Ленивый режим: файл для результата")
+    parser.add_argument('--run-size', type=int, default=LAZY_RUN_SIZE,
+                        help="Ленивый режим: размер серии внешней сортировки")
+    parser.add_argument('--profile', metavar='TRACE',
+                        help="Вывести время стадий и сохранить замеры в формате Chrome trace")
+    parser.add_argument('--workers', type=int,
+                        help="Выполнить f1-f3 на нескольких процессах (файл NDJSON делится по байтам)")
+    args = parser.parse_args(argv)
+    if args.workers and (args.lazy or args.output):
+        parser.error("--workers нельзя сочетать с --lazy и --output")
+    return args
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.profile:
+        profiler.max_events = TRACE_EVENTS
+    
     # Инициализация данных
     data = DEFAULT_DATA
     
-    # Чтение данных из файла, если он указан
-    if len(sys.argv) > 1:
+    # Потоковое чтение данных из файла (JSON-массив или NDJSON), если он указан:
+    # записи передаются в f1 по мере чтения, файл целиком в память не загружается
+    if args.file:
         try:
-            with open(sys.argv[1], 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            print(f"Данные загружены из файла: {sys.argv[1]}")
+            if args.workers:
+                # Процессы сами читают свои части файла - здесь только проверяется,
+                # что он открывается
+                with open(args.file, 'rb'):
+                    pass
+                data = args.file
+            else:
+                data = iter_records(args.file, progress=True)
+            print(f"Данные читаются из файла: {args.file}")
         except FileNotFoundError:
-            print(f"Файл {sys.argv[1]} не найден. Используются данные по умолчанию.")
-        except json.JSONDecodeError:
-            print(f"Ошибка чтения JSON из файла {sys.argv[1]}. Используются данные по умолчанию.")
+            print(f"Файл {args.file} не найден. Используются данные по умолчанию.")
         except Exception as e:
             print(f"Ошибка при загрузке файла: {e}. Используются данные по умолчанию.")
     else:
         print("Используются данные по умолчанию.")
     
-    print(f"Всего записей: {len(data)}")
+    if isinstance(data, list):
+        print(f"Всего записей: {len(data)}")
     
     # Выполнение пайплайна с замером времени
-    with cm_timer_1():
-        result = f4(f3(f2(f1(data))))
+    try:
+        with cm_timer_1(), profiler.section('pipeline'):
+            if args.workers:
+                with profiler.section('run_sharded'):
+                    names = run_sharded(data, args.workers)
+                result = f4(names)
+            elif args.lazy:
+                with profiler.section('run_lazy'):
+                    result = run_lazy(data, args.sample, args.output, args.run_size)
+                print(f"\nВсего результатов: {result}")
+            else:
+                result = f4(f3(f2(f1(data))))
+    except json.JSONDecodeError as e:
+        print(f"Ошибка чтения JSON из файла {args.file}: {e}")
+        return None
+    
+    if args.profile:
+        print()
+        profiler.report()
+        profiler.to_chrome_trace(args.profile)
+        print(f"Замеры сохранены в {args.profile}")
     
     return result
 
@@ -0,0 +1,327 @@
+import os
+import sys
+import math
+import numbers
+import time
+import sqlite3
+import tempfile
+from collections import OrderedDict
+from typing import Any, Dict
+
+class ExactSeen:
+    """
+    Точное множество просмотренных ключей (поведение по умолчанию)
+    
+    Память растёт вместе с числом уникальных ключей.
+    """
+    
+    def __init__(self):
+        self.keys = set()
+        self.checked = 0
+        self.passed = 0
+        self.started = None
+    
+    def add(self, key: Any) -> bool:
+        """Запоминает ключ; возвращает True, если ключ встретился впервые"""
+        if self.started is None:
+            self.started = time.perf_counter()
+        self.checked += 1
+        if key in self.keys:
+            return False
+        self.keys.add(key)
+        self.passed += 1
+        return True
+    
+    @property
+    def memory_bytes(self) -> int:
+        """Память под хеш-таблицу (без самих ключей)"""
+        return sys.getsizeof(self.keys)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Количество проверенных и уникальных ключей, память и скорость"""
+        elapsed = time.perf_counter() - self.started if self.started is not None else 0.0
+        return {
+            'backend': type(self).__name__,
+            'checked': self.checked,
+            'unique': self.passed,
+            'memory_bytes': self.memory_bytes,
+            'items_per_second': self.checked / elapsed if elapsed else 0.0,
+        }
+
+_MASK64 = (1 << 64) - 1
+
+def _mix64(value: int) -> int:
+    """Перемешивание 64-битного числа (финализатор splitmix64)"""
+    value = (value + 0x9E3779B97F4A7C15) & _MASK64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return value ^ (value >> 31)
+
+class BloomSeen(ExactSeen):
+    """
+    Приближённое множество на основе фильтра Блума
+    
+    Память фиксирована и задаётся ожидаемым числом уникальных ключей
+    и допустимой долей ложных срабатываний: с вероятностью error_rate
+    новый ключ будет ошибочно принят за уже встречавшийся (и пропущен).
+    Уже встречавшиеся ключи никогда не пропускаются повторно.
+    """
+    
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001):
+        if capacity <= 0 or not 0 < error_rate < 1:
+            raise ValueError("Нужны capacity > 0 и 0 < error_rate < 1")
+        super().__init__()
+        self.keys = None
+        self.capacity = capacity
+        self.error_rate = error_rate
+        # Оптимальные размер битового массива и число хеш-функций
+        self.size = max(8, int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+    
+    def _positions(self, key: Any):
+        # Двойное хеширование: h1 + i * h2 даёт hash_count позиций. Обе половины
+        # получаются перемешиванием одного хеша ключа: хеши кортежей (key, c)
+        # с разными c сильно коррелируют, и доля ложных срабатываний была
+        # на порядок выше error_rate
+        h1 = _mix64(hash(key) & _MASK64)
+        h2 = _mix64(h1) | 1
+        size = self.size
+        return [(h1 + i * h2) % size for i in range(self.hash_count)]
+    
+    def add(self, key: Any) -> bool:
+        if self.started is None:
+            self.started = time.perf_counter()
+        self.checked += 1
+        bits = self.bits
+        is_new = False
+        for position in self._positions(key):
+            byte, mask = position >> 3, 1 << (position & 7)
+            if not bits[byte] & mask:
+                bits[byte] |= mask
+                is_new = True
+        if is_new:
+            self.passed += 1
+        return is_new
+    
+    def __contains__(self, key: Any) -> bool:
+        """Проверка без добавления: True, если ключ (возможно) уже встречался"""
+        bits = self.bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+    
+    @property
+    def memory_bytes(self) -> int:
+        return len(self.bits)
+    
+    def stats(self) -> Dict[str, Any]:
+        result = super().stats()
+        # Ожидаемая доля ложных срабатываний при текущем заполнении
+        result['expected_error_rate'] = (1 - math.exp(-self.hash_count * self.passed / self.size)) ** self.hash_count
+        return result
+
+class WindowedSeen(ExactSeen):
+    """
+    Точное множество с вытеснением по окну
+    
+    Ключ считается повтором, только если он встречался среди последних
+    max_items запомненных ключей и/или не раньше чем ttl секунд назад.
+    Окно отсчитывается от первого появления ключа. Память ограничена
+    размером окна.
+    """
+    
+    def __init__(self, max_items: int = None, ttl: float = None, clock=time.monotonic):
+        if max_items is None and ttl is None:
+            raise ValueError("Нужно задать max_items и/или ttl")
+        super().__init__()
+        self.keys = OrderedDict()
+        self.max_items = max_items
+        self.ttl = ttl
+        self.clock = clock
+        self.evicted = 0
+    
+    def _evict(self, now: float):
+        keys = self.keys
+        if self.ttl is not None:
+            deadline = now - self.ttl
+            while keys and next(iter(keys.values())) < deadline:
+                keys.popitem(last=False)
+                self.evicted += 1
+        if self.max_items is not None:
+            while len(keys) > self.max_items:
+                keys.popitem(last=False)
+                self.evicted += 1
+    
+    def add(self, key: Any) -> bool:
+        if self.started is None:
+            self.started = time.perf_counter()
+        self.checked += 1
+        now = self.clock() if self.ttl is not None else 0.0
+        self._evict(now)
+        if key in self.keys:
+            return False
+        self.keys[key] = now
+        self.passed += 1
+        self._evict(now)
+        return True
+    
+    def stats(self) -> Dict[str, Any]:
+        result = super().stats()
+        result['window'] = len(self.keys)
+        result['evicted'] = self.evicted
+        return result
+
+def _encode(key: Any, parts: list):
+    # Каждое значение кодируется с меткой типа и длиной или завершающим
+    # символом, поэтому последовательность кодов однозначно разбирается
+    if key is None:
+        parts.append(b'N')
+    elif isinstance(key, float) and key.is_integer():
+        # 1.0 == 1 и -0.0 == 0.0 - как в множестве Python
+        parts.append(b'i%d;' % int(key))
+    elif isinstance(key, numbers.Integral):
+        # В том числе bool и целые NumPy
+        parts.append(b'i%d;' % int(key))
+    elif isinstance(key, float):
+        parts.append(b'f' + repr(key).encode('ascii') + b';')
+    elif isinstance(key, str):
+        data = key.encode('utf-8', 'surrogatepass')
+        parts.append(b's%d:' % len(data))
+        parts.append(data)
+    elif isinstance(key, bytes):
+        parts.append(b'b%d:' % len(key))
+        parts.append(key)
+    elif isinstance(key, (tuple, list)):
+        parts.append(b't%d:' % len(key) if isinstance(key, tuple) else b'l%d:' % len(key))
+        for item in key:
+            _encode(item, parts)
+    elif isinstance(key, (set, frozenset)):
+        # Порядок обхода множества не определён - коды элементов сортируются
+        parts.append(b'S%d:' % len(key))
+        parts.extend(sorted(encode_key(item) for item in key))
+    elif isinstance(key, dict):
+        parts.append(b'd%d:' % len(key))
+        parts.extend(sorted(encode_key(name) + encode_key(value) for name, value in key.items()))
+    else:
+        raise TypeError(f"Ключ типа {type(key).__name__} не поддерживается хранилищем на диске")
+
+def encode_key(key: Any) -> bytes:
+    """
+    Каноническое представление ключа в байтах
+    
+    Равные ключи дают одинаковые байты независимо от того, какие объекты
+    их составляют (в отличие от pickle, который запоминает повторы
+    по идентичности) и в каком порядке обходятся множества и словари.
+    """
+    parts = []
+    _encode(key, parts)
+    return b''.join(parts)
+
+class DiskSeen(ExactSeen):
+    """
+    Точное множество просмотренных ключей в базе SQLite на диске
+    
+    Для наборов ключей, не помещающихся в память. Последние cache_size
+    ключей хранятся в памяти (LRU), поэтому частые повторы не обращаются
+    к диску. И в памяти, и на диске ключи хранятся в каноническом
+    представлении (encode_key), поэтому равенство ключей то же, что
+    у ExactSeen (1, 1.0 и True - один ключ), и не зависит от cache_size.
+    Поддерживаются None, целые числа (и bool), float, str, bytes, кортежи, списки,
+    множества и словари из них; для других типов - TypeError.
+    Без path используется временный файл, удаляемый при close().
+    """
+    
+    def __init__(self, path: str = None, cache_size: int = 100_000, commit_every: int = 10_000):
+        super().__init__()
+        self.temporary = path is None
+        if self.temporary:
+            handle, path = tempfile.mkstemp(suffix='.sqlite')
+            os.close(handle)
+        self.path = path
+        self.keys = OrderedDict()
+        self.cache_size = cache_size
+        self.commit_every = commit_every
+        self.pending = 0
+        self.disk_hits = 0
+        self.connection = sqlite3.connect(path)
+        self.connection.execute('PRAGMA journal_mode=OFF')
+        self.connection.execute('PRAGMA synchronous=OFF')
+        self.connection.execute('CREATE TABLE IF NOT EXISTS seen (key BLOB PRIMARY KEY) WITHOUT ROWID')
+    
+    def add(self, key: Any) -> bool:
+        if self.started is None:
+            self.started = time.perf_counter()
+        self.checked += 1
+        # Кэш хранит те же байты, что и база: равенство ключей одинаково на обоих уровнях
+        blob = encode_key(key)
+        cache = self.keys
+        if blob in cache:
+            cache.move_to_end(blob)
+            return False
+        
+        cache[blob] = None
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+        
+        cursor = self.connection.execute(
+            'INSERT OR IGNORE INTO seen (key) VALUES (?)',
+            (blob,),
+        )
+        if cursor.rowcount != 1:
+            self.disk_hits += 1
+            return False
+        self.passed += 1
+        self.pending += 1
+        if self.pending >= self.commit_every:
+            self.connection.commit()
+            self.pending = 0
+        return True
+    
+    @property
+    def memory_bytes(self) -> int:
+        return sys.getsizeof(self.keys)
+    
+    def close(self):
+        """Сохраняет изменения и закрывает базу (временный файл удаляется)"""
+        if self.connection is None:
+            return
+        self.connection.commit()
+        self.connection.close()
+        self.connection = None
+        if self.temporary:
+            os.remove(self.path)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def stats(self) -> Dict[str, Any]:
+        result = super().stats()
+        result['disk_hits'] = self.disk_hits
+        if self.connection is not None:
+            self.connection.commit()
+            result['disk_bytes'] = os.path.getsize(self.path)
+        return result
+
+BACKENDS = {
+    'exact': ExactSeen,
+    'bloom': BloomSeen,
+    'window': WindowedSeen,
+    'disk': DiskSeen,
+}
+
+def make_seen(backend='exact', **options) -> ExactSeen:
+    """
+    Создаёт множество просмотренных ключей
+    
+    Args:
+        backend: 'exact', 'bloom', 'window', 'disk' или готовый объект множества
+        **options: Параметры конструктора (capacity, error_rate, max_items, ttl,
+                   path, cache_size)
+    """
+    if not isinstance(backend, str):
+        return backend
+    if backend not in BACKENDS:
+        raise ValueError(f"Неизвестное хранилище '{backend}', допустимы: {', '.join(BACKENDS)}")
+    return BACKENDS[backend](**options)
\ No newline at end of file
@@ -0,0 +1,132 @@
+import os
+import json
+import heapq
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+from field import field
+from json_stream import iter_records
+
+# Количество записей в одной части при разбиении потока записей
+SHARD_RECORDS = 50_000
+
+# Сколько частей на каждый процесс может находиться в обработке одновременно
+SHARDS_IN_FLIGHT = 2
+
+def starts_with_a(name: str) -> bool:
+    """Условие f2: имя начинается на 'А'"""
+    return name.lower().startswith('а')
+
+def add_phrase(name: str) -> str:
+    """Преобразование f3: добавить фразу к имени"""
+    return name + " смотрит в будущее"
+
+def _process_names(names: Iterable[str], predicate: Callable, transform: Callable) -> List[Tuple]:
+    """
+    Локальные стадии пайплайна для одной части: уникальные имена,
+    фильтр и преобразование. Возвращает отсортированный список
+    (имя в нижнем регистре, имя, результат) - вход для слияния частей.
+    """
+    unique_names = set(names)
+    if predicate is not None:
+        unique_names = filter(predicate, unique_names)
+    if transform is None:
+        rows = [(name.lower(), name, name) for name in unique_names]
+    else:
+        rows = [(name.lower(), name, transform(name)) for name in unique_names]
+    rows.sort()
+    return rows
+
+def _process_byte_range(path: str, start: int, end: int, predicate: Callable,
+                        transform: Callable) -> List[Tuple]:
+    """
+    Рабочий процесс: обрабатывает строки NDJSON, начинающиеся в [start, end)
+    
+    Строка, пересекающая границу, относится к части, в которой она начинается.
+    """
+    def records():
+        with open(path, 'rb') as file:
+            if start:
+                # Дочитываем строку, начавшуюся в предыдущей части
+                file.seek(start - 1)
+                file.readline()
+            position = file.tell()
+            while position < end:
+                line = file.readline()
+                if not line:
+                    break
+                position += len(line)
+                if line.strip():
+                    yield json.loads(line)
+    return _process_names(field(records(), 'name'), predicate, transform)
+
+def _process_records(records: List[Dict], predicate: Callable, transform: Callable) -> List[Tuple]:
+    """Рабочий процесс: обрабатывает часть записей, переданную списком"""
+    return _process_names(field(records, 'name'), predicate, transform)
+
+def _merge_shards(parts: List[List[Tuple]]) -> List[Any]:
+    """k-путевое слияние отсортированных частей с удалением повторов"""
+    result = []
+    previous = None
+    for _, name, value in heapq.merge(*parts):
+        if name != previous:
+            previous = name
+            result.append(value)
+    return result
+
+def _is_ndjson(path: str) -> bool:
+    with open(path, 'rb') as file:
+        head = file.read(4096)
+    return not head.lstrip(b' \t\r\n\xef\xbb\xbf').startswith(b'[')
+
+def run_sharded(source: Any, workers: int = None, predicate: Callable = starts_with_a,
+                transform: Callable = add_phrase, shard_records: int = SHARD_RECORDS) -> List[Any]:
+    """
+    Выполняет стадии f1-f3 на нескольких процессах
+    
+    Входные данные делятся на части: файл NDJSON - на диапазоны байтов
+    (каждый процесс читает свой диапазон сам), файл JSON-массива и другие
+    итерируемые записи - на списки по shard_records записей. Каждый процесс
+    выделяет имена, отбрасывает повторы, применяет фильтр и преобразование
+    и сортирует свою часть; затем части сливаются через кучу с удалением
+    повторов между частями. Результат совпадает с f3(f2(f1(data))).
+    Фильтр и преобразование должны сериализоваться pickle (не lambda).
+    
+    Args:
+        source: Путь к файлу (NDJSON или JSON-массив) или итерируемые записи
+        workers: Количество процессов (по умолчанию - число ядер)
+        predicate: Условие отбора имён (None - без фильтра)
+        transform: Преобразование имени (None - без преобразования)
+        shard_records: Размер части при разбиении потока записей
+    
+    Returns:
+        Преобразованные имена в порядке сортировки исходных имён
+    """
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        if isinstance(source, str) and _is_ndjson(source):
+            size = os.path.getsize(source)
+            step = -(-size // workers) or 1
+            starts = list(range(0, size, step))
+            parts = list(executor.map(
+                _process_byte_range, [source] * len(starts), starts,
+                [start + step for start in starts],
+                [predicate] * len(starts), [transform] * len(starts),
+            ))
+            return _merge_shards(parts)
+        
+        records = iter_records(source) if isinstance(source, str) else iter(source)
+        # Части отправляются по мере чтения, в обработке не более
+        # SHARDS_IN_FLIGHT частей на процесс - память ограничена
+        pending = deque()
+        parts = []
+        while True:
+            chunk = list(islice(records, shard_records))
+            if chunk:
+                pending.append(executor.submit(_process_records, chunk, predicate, transform))
+            if pending and (not chunk or len(pending) >= workers * SHARDS_IN_FLIGHT):
+                parts.append(pending.popleft().result())
+            if not chunk and not pending:
+                break
+        return _merge_shards(parts)
\ No newline at end of file
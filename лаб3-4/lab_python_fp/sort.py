@@ -1,69 +1,303 @@
-from typing import List, Any, Callable
+import os
+import heapq
+import pickle
+import random
+import tempfile
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from itertools import count, islice
+from operator import itemgetter
+from typing import List, Any, Callable, Iterable, Iterator
 
-def sort(arr: List[Any], key: Callable = None, reverse: bool = False) -> List[Any]:
+# Количество элементов в одной записи pickle во временном файле
+SPILL_BATCH = 4096
+
+# Максимальное число серий, сливаемых за один проход (ограничивает открытые файлы)
+MERGE_FAN_IN = 64
+
+# Размер списка, начиная с которого sort() использует процессы (если они заданы)
+PARALLEL_THRESHOLD = 1_000_000
+
+# Количество элементов выборки на один разделитель в параллельной сортировке
+SAMPLE_OVERSAMPLING = 64
+
+def _sort_in_place(arr: List[Any], key: Callable = None, reverse: bool = False) -> List[Any]:
+    """
+    Движок сортировки: сортирует список на месте и возвращает его
+    
+    Ключ вычисляется один раз для каждого элемента (decorate-sort-undecorate),
+    затем выполняется адаптивная устойчивая сортировка слиянием (timsort):
+    уже упорядоченные участки находятся за один проход, рекурсии нет,
+    поэтому глубина стека не зависит от размера и порядка входных данных.
+    При reverse=True равные элементы сохраняют исходный порядок.
+    """
+    arr.sort(key=key, reverse=reverse)
+    return arr
+
+def _partition_chunk(chunk: List[Any], key: Callable, splitters: List[Any]) -> List[List[Any]]:
+    """
+    Рабочий процесс: вычисляет ключи элементов своей части и раскладывает
+    их по корзинам между разделителями (элементы с ключом - парами (ключ, элемент))
+    """
+    buckets = [[] for _ in range(len(splitters) + 1)]
+    if key:
+        for item in chunk:
+            item_key = key(item)
+            buckets[bisect_right(splitters, item_key)].append((item_key, item))
+    else:
+        for item in chunk:
+            buckets[bisect_right(splitters, item)].append(item)
+    return buckets
+
+def _sort_bucket(bucket: List[Any], keyed: bool, reverse: bool) -> List[Any]:
+    """Рабочий процесс: сортирует корзину по готовым ключам"""
+    if keyed:
+        bucket.sort(key=itemgetter(0), reverse=reverse)
+        return [item for _, item in bucket]
+    return _sort_in_place(bucket, None, reverse)
+
+def _is_picklable(value) -> bool:
+    try:
+        pickle.dumps(value)
+        return True
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return False
+
+def parallel_sort(arr: List[Any], key: Callable = None, reverse: bool = False,
+                  workers: int = None) -> List[Any]:
+    """
+    Параллельная сортировка выборкой (sample sort) на пуле процессов
+    
+    По случайной выборке выбираются разделители, каждый процесс раскладывает
+    свою часть списка по корзинам (вычисляя ключи), затем корзины сортируются
+    в процессах и склеиваются по порядку. Сортировка устойчива.
+    Функция ключа должна сериализоваться pickle (не lambda), иначе
+    сортировка выполняется в текущем процессе.
+    
+    Args:
+        arr: Список для сортировки
+        key: Функция ключа для сравнения
+        reverse: Обратный порядок сортировки
+        workers: Количество процессов (по умолчанию - число ядер)
+    """
+    items = list(arr)
+    if len(items) <= 1 or (key is not None and not _is_picklable(key)):
+        return _sort_in_place(items, key, reverse)
+    
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Разделители - равноотстоящие ключи отсортированной случайной выборки
+        sample = random.sample(items, min(len(items), workers * SAMPLE_OVERSAMPLING))
+        sample_keys = sorted(map(key, sample) if key else sample)
+        splitters = sample_keys[SAMPLE_OVERSAMPLING::SAMPLE_OVERSAMPLING][:workers - 1]
+        
+        chunk_size = -(-len(items) // workers)
+        chunks = [items[start:start + chunk_size] for start in range(0, len(items), chunk_size)]
+        del items
+        partitions = list(executor.map(_partition_chunk, chunks, [key] * len(chunks),
+                                       [splitters] * len(chunks)))
+        del chunks
+        
+        # Корзина собирается из частей в исходном порядке - это сохраняет устойчивость
+        buckets = [[item for partition in partitions for item in partition[index]]
+                   for index in range(len(splitters) + 1)]
+        del partitions
+        if reverse:
+            buckets.reverse()
+        
+        result = []
+        for sorted_bucket in executor.map(_sort_bucket, buckets, [key is not None] * len(buckets),
+                                          [reverse] * len(buckets)):
+            result.extend(sorted_bucket)
+    return result
+
+def sort(arr: List[Any], key: Callable = None, reverse: bool = False,
+         workers: int = None, parallel_threshold: int = PARALLEL_THRESHOLD) -> List[Any]:
     """
-    Функция сортировки с использованием быстрой сортировки
+    Функция сортировки
     
     Args:
         arr: Список для сортировки
         key: Функция ключа для сравнения
         reverse: Обратный порядок сортировки
+        workers: Количество процессов для параллельной сортировки (None - без процессов)
+        parallel_threshold: Минимальный размер списка для параллельной сортировки
     
     Returns:
-        Отсортированный список
+        Отсортированный список (исходный список не изменяется)
     """
-    if len(arr) <= 1:
-        return arr
+    if workers is not None and workers > 1 and len(arr) >= parallel_threshold:
+        return parallel_sort(arr, key, reverse, workers)
+    return _sort_in_place(list(arr), key, reverse)
+
+def _spill_run(run: List[Any], temp_dir: str = None):
+    """Записывает отсортированную серию во временный файл порциями pickle"""
+    file = tempfile.TemporaryFile(dir=temp_dir)
+    for start in range(0, len(run), SPILL_BATCH):
+        pickle.dump(run[start:start + SPILL_BATCH], file, protocol=pickle.HIGHEST_PROTOCOL)
+    file.seek(0)
+    return file
+
+def _read_run(file) -> Iterator[Any]:
+    """Читает серию из временного файла порция за порцией"""
+    while True:
+        try:
+            batch = pickle.load(file)
+        except EOFError:
+            return
+        yield from batch
+
+def _merge_to_file(files, run_key: Callable, reverse: bool, temp_dir: str = None):
+    """Сливает несколько серий в одну новую серию во временном файле"""
+    output = tempfile.TemporaryFile(dir=temp_dir)
+    batch = []
+    for item in heapq.merge(*(_read_run(file) for file in files), key=run_key, reverse=reverse):
+        batch.append(item)
+        if len(batch) == SPILL_BATCH:
+            pickle.dump(batch, output, protocol=pickle.HIGHEST_PROTOCOL)
+            batch = []
+    if batch:
+        pickle.dump(batch, output, protocol=pickle.HIGHEST_PROTOCOL)
+    for file in files:
+        file.close()
+    output.seek(0)
+    return output
+
+def external_sort(items: Iterable[Any], key: Callable = None, reverse: bool = False,
+                  run_size: int = 1_000_000, temp_dir: str = None) -> Iterator[Any]:
+    """
+    Внешняя сортировка слиянием для данных, не помещающихся в память
     
-    pivot = arr[len(arr) // 2]
+    Входные данные читаются сериями по run_size элементов, каждая серия
+    сортируется в памяти и сбрасывается во временный файл, затем серии
+    сливаются k-путевым слиянием через кучу (не более MERGE_FAN_IN серий
+    за проход, лишние серии предварительно сливаются в более длинные).
+    В памяти одновременно находятся одна серия при разбиении и по одной
+    порции из каждого файла при слиянии.
+    Ключи вычисляются один раз и хранятся в файлах вместе с элементами.
+    Сортировка устойчива.
     
-    if key:
-        pivot_val = key(pivot)
-        left = [x for x in arr if key(x) < pivot_val]
-        middle = [x for x in arr if key(x) == pivot_val]
-        right = [x for x in arr if key(x) > pivot_val]
-    else:
-        left = [x for x in arr if x < pivot]
-        middle = [x for x in arr if x == pivot]
-        right = [x for x in arr if x > pivot]
+    Args:
+        items: Итерируемый источник данных
+        key: Функция ключа для сравнения
+        reverse: Обратный порядок сортировки
+        run_size: Максимальное количество элементов серии в памяти
+        temp_dir: Каталог для временных файлов
+    
+    Yields:
+        Элементы в порядке сортировки
+    """
+    if run_size <= 0:
+        raise ValueError("Размер серии должен быть положительным")
     
-    result = sort(left, key, reverse) + middle + sort(right, key, reverse)
+    iterator = iter(items)
+    run_key = itemgetter(0) if key else None
+    files = []
+    try:
+        while True:
+            run = list(islice(iterator, run_size))
+            if key:
+                run = [(key(item), item) for item in run]
+            _sort_in_place(run, run_key, reverse)
+            
+            if not files and len(run) < run_size:
+                # Все данные поместились в одну серию - временные файлы не нужны
+                yield from (pair[1] for pair in run) if key else run
+                return
+            if run:
+                files.append(_spill_run(run, temp_dir))
+            if len(files) == MERGE_FAN_IN:
+                # Первые серии идут раньше по входу, поэтому слияние остаётся устойчивым
+                files = [_merge_to_file(files, run_key, reverse, temp_dir)]
+            if len(run) < run_size:
+                break
+            del run
+        
+        merged = heapq.merge(*(_read_run(file) for file in files), key=run_key, reverse=reverse)
+        if key:
+            for _, item in merged:
+                yield item
+        else:
+            yield from merged
+    finally:
+        for file in files:
+            file.close()
+
+def top_k(items: Iterable[Any], k: int, key: Callable = None, reverse: bool = False) -> List[Any]:
+    """
+    Первые k элементов в порядке сортировки за O(n log k)
     
-    return result if not reverse else result[::-1]
+    Результат совпадает с sort(items, key, reverse)[:k], но хранится только
+    куча из k элементов, а ключ вычисляется один раз для каждого элемента.
+    
+    Args:
+        items: Итерируемый источник данных
+        k: Количество элементов
+        key: Функция ключа для сравнения
+        reverse: Обратный порядок сортировки (k наибольших)
+    """
+    if reverse:
+        return heapq.nlargest(k, items, key=key)
+    return heapq.nsmallest(k, items, key=key)
+
+class _Reversed:
+    """Обёртка ключа с обратным порядком сравнения для кучи"""
+    __slots__ = ('value',)
+    
+    def __init__(self, value):
+        self.value = value
+    
+    def __lt__(self, other):
+        return other.value < self.value
+    
+    def __eq__(self, other):
+        return self.value == other.value
+
+def _heap_sort_lazy(items: Iterable[Any], key: Callable = None, reverse: bool = False) -> Iterator[Any]:
+    """
+    Инкрементальная сортировка кучей: построение кучи занимает O(n),
+    каждый следующий элемент - O(log n). Номер элемента во входных данных
+    разрешает равенство ключей, поэтому порядок устойчив.
+    """
+    items = list(items)
+    keys = map(key, items) if key else items
+    if reverse:
+        keys = map(_Reversed, keys)
+    heap = list(zip(keys, count(), items))
+    heapq.heapify(heap)
+    
+    while heap:
+        yield heapq.heappop(heap)[2]
 
 # Альтернативная реализация как класс
 class sort_by:
+    """
+    Итератор по отсортированным элементам
+    
+    Параметры: key, reverse, а также:
+        run_size - если задан, сортировка выполняется внешним слиянием
+            (external_sort) через временные файлы в каталоге temp_dir
+            и весь набор данных никогда не хранится в памяти;
+        lazy - если True, элементы извлекаются из кучи по запросу, и первые
+            k элементов стоят O(n + k log n) вместо полной сортировки.
+    """
+    
     def __init__(self, items, **kwargs):
         self.key = kwargs.get('key', None)
         self.reverse = kwargs.get('reverse', False)
-        self.sorted_items = self._quicksort(list(items))
-        self.index = 0
-    
-    def _quicksort(self, arr):
-        if len(arr) <= 1:
-            return arr
-        
-        pivot = arr[len(arr) // 2]
+        self.run_size = kwargs.get('run_size', None)
+        self.temp_dir = kwargs.get('temp_dir', None)
+        self.lazy = kwargs.get('lazy', False)
         
-        if self.key:
-            pivot_val = self.key(pivot)
-            left = [x for x in arr if self.key(x) < pivot_val]
-            middle = [x for x in arr if self.key(x) == pivot_val]
-            right = [x for x in arr if self.key(x) > pivot_val]
+        if self.run_size is not None:
+            self._iterator = external_sort(items, self.key, self.reverse, self.run_size, self.temp_dir)
+        elif self.lazy:
+            self._iterator = _heap_sort_lazy(items, self.key, self.reverse)
         else:
-            left = [x for x in arr if x < pivot]
-            middle = [x for x in arr if x == pivot]
-            right = [x for x in arr if x > pivot]
-        
-        result = self._quicksort(left) + middle + self._quicksort(right)
-        return result if not self.reverse else result[::-1]
+            self._iterator = iter(_sort_in_place(list(items), self.key, self.reverse))
     
     def __iter__(self):
         return self
     
     def __next__(self):
-        if self.index < len(self.sorted_items):
-            result = self.sorted_items[self.index]
-            self.index += 1
-            return result
-        raise StopIteration
\ No newline at end of file
+        return next(self._iterator)
\ No newline at end of file
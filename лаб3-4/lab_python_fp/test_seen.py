@@ -0,0 +1,84 @@
+"""
+Тесты хранилищ просмотренных ключей (unittest)
+"""
+import unittest
+from seen import BloomSeen, DiskSeen
+from unique import Unique
+
+class TestBloomSeen(unittest.TestCase):
+    """Тесты фильтра Блума"""
+    
+    def check_error_rate(self, make_key):
+        # Arrange
+        capacity, error_rate = 20_000, 0.01
+        seen = BloomSeen(capacity=capacity, error_rate=error_rate)
+        
+        # Act - заполнение до capacity, затем проверка новых ключей без добавления
+        for number in range(capacity):
+            seen.add(make_key(number))
+        false_positives = sum(make_key(number) in seen for number in range(capacity, 2 * capacity))
+        
+        # Assert - доля ложных срабатываний близка к заданной
+        self.assertLess(false_positives / capacity, 1.5 * error_rate)
+        self.assertAlmostEqual(seen.stats()['expected_error_rate'], error_rate, delta=error_rate / 2)
+    
+    def test_error_rate_int_keys(self):
+        """Тест доли ложных срабатываний для целых ключей"""
+        self.check_error_rate(lambda number: number)
+    
+    def test_error_rate_str_keys(self):
+        """Тест доли ложных срабатываний для строковых ключей"""
+        self.check_error_rate(lambda number: f"name{number}")
+    
+    def test_repeated_keys_rejected(self):
+        """Тест: встречавшийся ключ не пропускается повторно"""
+        # Arrange
+        seen = BloomSeen(capacity=100, error_rate=0.01)
+        
+        # Act
+        first = seen.add('Анна')
+        second = seen.add('Анна')
+        
+        # Assert
+        self.assertTrue(first)
+        self.assertFalse(second)
+        self.assertIn('Анна', seen)
+
+class TestDiskSeen(unittest.TestCase):
+    """Тесты хранилища на диске"""
+    
+    def test_equal_tuple_keys(self):
+        """Тест: равные, но не идентичные составные ключи - один ключ"""
+        # Arrange - строки равны, но это разные объекты
+        first = {'name': 'Анна', 'city': 'Москва'}
+        second = {'name': ''.join(['Ан', 'на']), 'city': 'Москва'}
+        records = [first, second]
+        
+        # Act
+        result = list(Unique(records, key=lambda record: (record['name'], record['city']), backend='disk'))
+        
+        # Assert - как у точного множества
+        self.assertEqual(result, [first])
+        self.assertEqual(result, list(Unique(records, key=lambda record: (record['name'], record['city']))))
+    
+    def test_equal_numbers_and_containers(self):
+        """Тест: равенство ключей как у множества Python, независимо от cache_size"""
+        # Arrange
+        keys = [1, 1.0, True, 0.0, -0.0, frozenset('ab'), frozenset('ba'), ('x', 1), ('x', 1.0)]
+        
+        for cache_size in (0, 100):
+            with DiskSeen(cache_size=cache_size) as seen:
+                # Act
+                added = [seen.add(key) for key in keys]
+            
+            # Assert
+            self.assertEqual(added, [True, False, False, True, False, True, False, True, False])
+    
+    def test_unsupported_key(self):
+        """Тест: ключ неподдерживаемого типа отклоняется"""
+        with DiskSeen() as seen:
+            with self.assertRaises(TypeError):
+                seen.add(object())
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
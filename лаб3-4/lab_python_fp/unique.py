@@ -1,16 +1,95 @@
+import sys
 from typing import List, Any, Callable
+from seen import make_seen
 
-def Unique(arr: List[Any], ignore_case: bool = False) -> List[Any]:
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+def _first_occurrences(keys) -> Any:
+    """Индексы первых появлений значений одномерного массива в порядке появления"""
+    # np.unique(return_index=True) использует устойчивую сортировку - быстрее
+    # обычная сортировка и минимальный исходный индекс в каждой группе равных
+    order = np.argsort(keys)
+    ordered = keys[order]
+    starts = np.empty(len(keys), dtype=bool)
+    starts[:1] = True
+    np.not_equal(ordered[1:], ordered[:-1], out=starts[1:])
+    return np.sort(np.minimum.reduceat(order, np.flatnonzero(starts)))
+
+def unique_batch(arr, ignore_case: bool = False) -> List[Any]:
+    """
+    Уникальные элементы списка, кортежа или одномерного массива NumPy
+    
+    Результат совпадает с list(Unique(arr, ignore_case)), но дубликаты
+    отбрасываются пакетно: для массивов - сортировкой NumPy, для списков
+    без ignore_case - словарём, построенным на уровне C. Для списка строк
+    регистр понижается одним вызовом map для всего списка.
+    """
+    if NUMPY_AVAILABLE and isinstance(arr, np.ndarray) and arr.ndim == 1 and arr.dtype != object:
+        if not len(arr):
+            return []
+        keys = np.char.lower(arr) if ignore_case and arr.dtype.kind == 'U' else arr
+        return list(arr[_first_occurrences(keys)])
+    
+    if not ignore_case:
+        return list(dict.fromkeys(arr))
+    
+    try:
+        keys = list(map(str.lower, arr))
+    except TypeError:
+        # Не только строки - ключи вычисляются поэлементно
+        return list(_unique_with(arr, ignore_case, make_seen('exact')))
+    seen = set()
+    add = seen.add
+    result = []
+    append = result.append
+    for key, item in zip(keys, arr):
+        if key not in seen:
+            add(key)
+            append(item)
+    return result
+
+def Unique(arr: List[Any], ignore_case: bool = False, backend: Any = 'exact',
+           key: Callable = None, **options) -> List[Any]:
     """
     Генератор для получения уникальных элементов из списка
     
     Args:
         arr: Входной список
         ignore_case: Игнорировать регистр для строк
+        backend: Хранилище просмотренных ключей: 'exact' (множество, по умолчанию),
+                 'bloom' (фильтр Блума), 'window' (окно с вытеснением),
+                 'disk' (SQLite на диске) или готовый объект из модуля seen -
+                 по нему доступна статистика
+        key: Функция, вычисляющая ключ сравнения элемента (например, поле записи);
+             ignore_case применяется к ключу, если он строка
+        **options: Параметры хранилища (capacity, error_rate, max_items, ttl,
+                   path, cache_size)
+    
+    Одномерные числовые и строковые массивы NumPy с хранилищем по умолчанию
+    обрабатываются пакетно (unique_batch): результат вычисляется целиком при
+    первом обращении. Списки и кортежи обходятся лениво.
     
     Yields:
         Уникальные элементы в порядке первого появления
     """
+    if backend != 'exact' or options or key is not None:
+        seen = make_seen(backend, **options)
+        try:
+            yield from _unique_with(arr, ignore_case, seen, key)
+        finally:
+            # Хранилище, созданное здесь же по имени, закрывается вместе с генератором
+            if isinstance(backend, str) and hasattr(seen, 'close'):
+                seen.close()
+        return
+    
+    if NUMPY_AVAILABLE and isinstance(arr, np.ndarray) and arr.ndim == 1 and arr.dtype != object:
+        yield from unique_batch(arr, ignore_case)
+        return
+    
     seen = set()
     
     for item in arr:
@@ -23,21 +102,74 @@ def Unique(arr: List[Any], ignore_case: bool = False) -> List[Any]:
             seen.add(key)
             yield item
 
+def _unique_with(arr, ignore_case: bool, seen, key: Callable = None) -> Any:
+    """Уникальные элементы с произвольным хранилищем просмотренных ключей"""
+    add = seen.add
+    for item in arr:
+        item_key = key(item) if key is not None else item
+        if ignore_case and isinstance(item_key, str):
+            item_key = item_key.lower()
+        if add(item_key):
+            yield item
+
+def _unique_set(arr, ignore_case: bool, seen: set, key: Callable = None) -> Any:
+    """Уникальные элементы с обычным множеством (без счётчиков хранилища)"""
+    if key is None and not ignore_case:
+        for item in arr:
+            if item not in seen:
+                seen.add(item)
+                yield item
+        return
+    
+    for item in arr:
+        item_key = key(item) if key is not None else item
+        if ignore_case and isinstance(item_key, str):
+            item_key = item_key.lower()
+        if item_key not in seen:
+            seen.add(item_key)
+            yield item
+
 # Альтернативная реализация как класс
 class unique:
     def __init__(self, items, **kwargs):
         self.items = iter(items)
-        self.ignore_case = kwargs.get('ignore_case', False)
-        self.seen = set()
+        self.ignore_case = kwargs.pop('ignore_case', False)
+        self.key = kwargs.pop('key', None)
+        backend = kwargs.pop('backend', 'exact')
+        # stats=True - вести полную статистику и для точного множества
+        track_stats = kwargs.pop('stats', False)
+        # Остальные параметры (capacity, error_rate, max_items, ttl,
+        # path, cache_size) - для хранилища
+        self.tracked = backend != 'exact' or bool(kwargs) or track_stats
+        if self.tracked:
+            self.seen = make_seen(backend, **kwargs)
+            self._iterator = _unique_with(self.items, self.ignore_case, self.seen, self.key)
+        else:
+            self.seen = set()
+            self._iterator = _unique_set(self.items, self.ignore_case, self.seen, self.key)
     
     def __iter__(self):
         return self
     
     def __next__(self):
-        while True:
-            item = next(self.items)
-            key = item.lower() if self.ignore_case and isinstance(item, str) else item
-            
-            if key not in self.seen:
-                self.seen.add(key)
-                return item
\ No newline at end of file
+        return next(self._iterator)
+    
+    def stats(self):
+        """
+        Статистика хранилища: проверено, уникальных, память, скорость
+        
+        Для точного множества без stats=True доступны только
+        количество уникальных ключей и память.
+        """
+        if not self.tracked:
+            return {
+                'backend': 'set',
+                'unique': len(self.seen),
+                'memory_bytes': sys.getsizeof(self.seen),
+            }
+        return self.seen.stats()
+    
+    def close(self):
+        """Освобождает хранилище (для 'disk' - закрывает базу)"""
+        if hasattr(self.seen, 'close'):
+            self.seen.close()
\ No newline at end of file
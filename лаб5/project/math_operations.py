@@ -2,6 +2,13 @@
 Модуль математических операций для тестирования
 """
 import random
+from itertools import repeat
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 def field(items, *args):
     """
@@ -10,23 +17,49 @@ def field(items, *args):
     if len(args) == 0:
         return
     
+    if len(args) == 1:
+        field_name = args[0]
+        for item in items:
+            if isinstance(item, dict):
+                value = item.get(field_name)
+                if value is not None:
+                    yield value
+        return
+    
     for item in items:
         if not isinstance(item, dict):
             continue
-            
-        if len(args) == 1:
-            field_name = args[0]
-            if field_name in item and item[field_name] is not None:
-                yield item[field_name]
-        else:
-            result = {}
-            has_valid_fields = False
-            for field_name in args:
-                if field_name in item and item[field_name] is not None:
-                    result[field_name] = item[field_name]
-                    has_valid_fields = True
-            if has_valid_fields:
-                yield result
+        result = {}
+        for field_name in args:
+            value = item.get(field_name)
+            if value is not None:
+                result[field_name] = value
+        if result:
+            yield result
+
+def field_columns(items, *args, as_numpy=False, fill_value=None):
+    """
+    Выборка полей из словарей по столбцам {поле: список значений}
+    
+    i-е значения всех столбцов относятся к одной записи; отсутствующие
+    поля и None заменяются на fill_value. При as_numpy=True столбцы -
+    массивы NumPy.
+    """
+    if as_numpy and not NUMPY_AVAILABLE:
+        raise ImportError("Для as_numpy=True требуется библиотека numpy")
+    
+    rows = [item for item in items if isinstance(item, dict)]
+    columns = {}
+    for field_name in args:
+        column = list(map(dict.get, rows, repeat(field_name)))
+        if fill_value is not None:
+            column = [fill_value if value is None else value for value in column]
+        columns[field_name] = column
+    
+    if as_numpy:
+        for field_name, column in columns.items():
+            columns[field_name] = np.array(column, dtype=object if None in column else None)
+    return columns
 
 def gen_random(num_count, min_value, max_value):
     """
@@ -34,6 +67,41 @@ def gen_random(num_count, min_value, max_value):
     """
     return [random.randint(min_value, max_value) for _ in range(num_count)]
 
+def gen_random_array(num_count, min_value, max_value, seed=None):
+    """
+    Случайные числа одним массивом NumPy (границы включаются)
+    
+    seed - зерно, SeedSequence или np.random.Generator; без NumPy - список
+    """
+    if not NUMPY_AVAILABLE:
+        generator = seed if isinstance(seed, random.Random) else random.Random(seed)
+        return [generator.randint(min_value, max_value) for _ in range(num_count)]
+    rng = seed if isinstance(seed, np.random.Generator) else np.random.default_rng(seed)
+    return rng.integers(min_value, max_value, size=num_count, endpoint=True)
+
+def gen_random_chunks(num_count, min_value, max_value, seed=None, chunk_size=1_000_000):
+    """
+    Потоковая генерация порциями по chunk_size чисел
+    
+    При одинаковом seed последовательность не зависит от chunk_size
+    """
+    if chunk_size <= 0:
+        raise ValueError("Размер порции должен быть положительным")
+    if NUMPY_AVAILABLE:
+        generator = seed if isinstance(seed, np.random.Generator) else np.random.default_rng(seed)
+    else:
+        generator = random.Random(seed)
+    for start in range(0, num_count, chunk_size):
+        yield gen_random_array(min(chunk_size, num_count - start), min_value, max_value, generator)
+
+def spawn_generators(count, seed=None):
+    """
+    Независимые воспроизводимые генераторы для параллельных процессов (SeedSequence.spawn)
+    """
+    if not NUMPY_AVAILABLE:
+        raise ImportError("Для spawn_generators требуется библиотека numpy")
+    return [np.random.default_rng(child) for child in np.random.SeedSequence(seed).spawn(count)]
+
 def filter_data(data, condition_func):
     """
     Фильтрация данных по условию
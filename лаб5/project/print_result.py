@@ -2,24 +2,113 @@
 Декоратор для вывода результатов
 """
 from functools import wraps
+from itertools import islice
+import atexit
+import queue
+import sys
+import threading
 
-def print_result(func):
+class BackgroundSink:
+    """
+    Вывод в фоновом потоке: вызывающий код только кладёт текст в очередь,
+    запись в поток выполняет отдельный поток. flush() дожидается записи.
+    """
+    
+    def __init__(self, stream=None):
+        self.stream = stream
+        self.queue = queue.Queue()
+        # Ошибка записи в фоновом потоке, ещё не переданная вызывающему коду
+        self.error = None
+        self.thread = threading.Thread(target=self._run, name='print_result', daemon=True)
+        self.thread.start()
+        atexit.register(self.flush)
+    
+    def _run(self):
+        while True:
+            parts = [self.queue.get()]
+            # Всё, что успело накопиться, записывается одной операцией
+            while True:
+                try:
+                    parts.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            stream = self.stream if self.stream is not None else sys.stdout
+            try:
+                stream.write(''.join(parts))
+                stream.flush()
+            except Exception as error:
+                # Поток вывода закрыт или недоступен: ошибка передаётся
+                # вызывающему коду при следующем write/flush
+                self.error = error
+            finally:
+                # Иначе flush() (в том числе при выходе) ждал бы вечно
+                for _ in parts:
+                    self.queue.task_done()
+    
+    def _raise_error(self):
+        error, self.error = self.error, None
+        if error is not None:
+            raise error
+    
+    def write(self, text):
+        self._raise_error()
+        self.queue.put(text)
+    
+    def flush(self):
+        self.queue.join()
+        self._raise_error()
+
+def _format_value(value, max_chars):
+    text = str(value)
+    if max_chars is not None and len(text) > max_chars:
+        return text[:max_chars] + '...'
+    return text
+
+def format_result(name, result, max_items=None, max_chars=None):
+    """
+    Текст вывода результата функции (одна строка на элемент)
+    """
+    lines = [f"\nРезультат функции {name}:"]
+    if isinstance(result, (dict, list)):
+        if isinstance(result, dict):
+            items = (f"{key}: {_format_value(value, max_chars)}" for key, value in result.items())
+        else:
+            items = (_format_value(item, max_chars) for item in result)
+        lines.extend(f"  {item}" for item in islice(items, max_items))
+        if max_items is not None and len(result) > max_items:
+            lines.append(f"  ... ещё {len(result) - max_items} элементов")
+    else:
+        lines.append(f"  {_format_value(result, max_chars)}")
+    return "\n".join(lines) + "\n"
+
+def print_result(func=None, *, every=1, max_items=None, max_chars=None, sink=None):
     """
     Декоратор для вывода результата функции
+    
+    Используется как @print_result или с параметрами:
+    every - выводить каждый every-й вызов (первый выводится всегда),
+    max_items - сколько элементов результата выводить,
+    max_chars - максимальная длина одного элемента,
+    sink - объект с методом write (BackgroundSink, файл), по умолчанию sys.stdout
     """
+    if func is None:
+        return lambda function: print_result(function, every=every, max_items=max_items,
+                                             max_chars=max_chars, sink=sink)
+    
+    calls = 0
+    
     @wraps(func)
     def wrapper(*args, **kwargs):
+        nonlocal calls
         result = func(*args, **kwargs)
         
-        print(f"\nРезультат функции {func.__name__}:")
-        if isinstance(result, dict):
-            for key, value in result.items():
-                print(f"  {key}: {value}")
-        elif isinstance(result, list):
-            for item in result:
-                print(f"  {item}")
-        else:
-            print(f"  {result}")
+        calls += 1
+        if every > 1 and calls % every != 1:
+            return result
+        
+        # Весь вывод записывается одной операцией
+        text = format_result(func.__name__, result, max_items, max_chars)
+        (sink if sink is not None else sys.stdout).write(text)
         
         return result
     return wrapper
\ No newline at end of file
@@ -2,7 +2,9 @@
 Модульные тесты с использованием TDD подхода (unittest)
 """
 import unittest
-from math_operations import field, gen_random, filter_data, transform_data, calculate_average, DataProcessor
+from math_operations import (field, field_columns, gen_random, gen_random_array, gen_random_chunks,
+                             spawn_generators, filter_data, transform_data, calculate_average,
+                             DataProcessor, NUMPY_AVAILABLE)
 
 class TestMathOperationsTDD(unittest.TestCase):
     """TDD тесты для математических операций"""
@@ -65,6 +67,65 @@ class TestMathOperationsTDD(unittest.TestCase):
         for i, expected in enumerate(expected_results):
             self.assertEqual(result[i], expected)
     
+    def test_field_columns(self):
+        """Тест выборки полей по столбцам"""
+        # Act
+        result = field_columns(self.test_data + ['не словарь'], 'name', 'age')
+        
+        # Assert - столбцы выровнены по записям, пропуски - None
+        self.assertEqual(result['name'], ['Анна', 'Алексей', 'Мария', None, 'Ольга'])
+        self.assertEqual(result['age'], [25, 30, 28, 35, None])
+    
+    def test_field_columns_fill_value(self):
+        """Тест замены пропусков в столбцах"""
+        # Act
+        result = field_columns(self.test_data, 'age', fill_value=0)
+        
+        # Assert
+        self.assertEqual(result, {'age': [25, 30, 28, 35, 0]})
+    
+    @unittest.skipUnless(NUMPY_AVAILABLE, "numpy не установлен")
+    def test_field_columns_numpy(self):
+        """Тест выборки столбцов в массивы NumPy"""
+        # Act
+        result = field_columns(self.test_data, 'salary', 'age', as_numpy=True, fill_value=float('nan'))
+        
+        # Assert
+        self.assertEqual(result['salary'].tolist(), [50000, 60000, 55000, 70000, 45000])
+        self.assertEqual(result['age'].dtype.kind, 'f')
+        self.assertEqual(int(result['age'][:4].sum()), 118)
+    
+    def test_gen_random_array_reproducible(self):
+        """Тест воспроизводимости и границ gen_random_array"""
+        # Act
+        first = list(gen_random_array(1000, 1, 6, seed=7))
+        second = list(gen_random_array(1000, 1, 6, seed=7))
+        
+        # Assert - границы включаются, как в random.randint
+        self.assertEqual(first, second)
+        self.assertEqual(set(first), {1, 2, 3, 4, 5, 6})
+    
+    def test_gen_random_chunks(self):
+        """Тест потоковой генерации порциями"""
+        # Act
+        chunks = list(gen_random_chunks(10, 0, 100, seed=3, chunk_size=4))
+        
+        # Assert - последовательность не зависит от размера порции
+        self.assertEqual([len(chunk) for chunk in chunks], [4, 4, 2])
+        values = [value for chunk in chunks for value in chunk]
+        self.assertEqual(values, list(gen_random_array(10, 0, 100, seed=3)))
+    
+    @unittest.skipUnless(NUMPY_AVAILABLE, "numpy не установлен")
+    def test_spawn_generators(self):
+        """Тест независимых генераторов для процессов"""
+        # Act
+        streams = [gen_random_array(5, 0, 10**9, generator).tolist() for generator in spawn_generators(3, seed=1)]
+        again = [gen_random_array(5, 0, 10**9, generator).tolist() for generator in spawn_generators(3, seed=1)]
+        
+        # Assert - потоки различаются между собой и воспроизводятся по seed
+        self.assertEqual(streams, again)
+        self.assertEqual(len({tuple(stream) for stream in streams}), 3)
+    
     def test_filter_data(self):
         """Тест фильтрации данных"""
         # Arrange
@@ -0,0 +1,97 @@
+"""
+Тесты декоратора print_result (unittest)
+"""
+import io
+import unittest
+from unittest.mock import patch
+from print_result import print_result, BackgroundSink
+
+class TestPrintResult(unittest.TestCase):
+    """Тесты вывода, выборки и ограничений print_result"""
+    
+    def test_default_output(self):
+        """Тест вывода без параметров"""
+        # Arrange
+        @print_result
+        def names():
+            return ['Анна', 'Андрей']
+        
+        # Act
+        with patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            result = names()
+        
+        # Assert
+        self.assertEqual(result, ['Анна', 'Андрей'])
+        self.assertEqual(stdout.getvalue(), "\nРезультат функции names:\n  Анна\n  Андрей\n")
+    
+    def test_every_nth_call(self):
+        """Тест вывода каждого N-го вызова"""
+        # Arrange
+        sink = io.StringIO()
+        
+        @print_result(every=3, sink=sink)
+        def square(x):
+            return x * x
+        
+        # Act
+        results = [square(x) for x in range(7)]
+        
+        # Assert - выводятся 1-й, 4-й и 7-й вызовы, результаты не меняются
+        self.assertEqual(results, [0, 1, 4, 9, 16, 25, 36])
+        self.assertEqual(sink.getvalue().count("Результат функции square"), 3)
+        self.assertIn("  9\n", sink.getvalue())
+        self.assertNotIn("  4\n", sink.getvalue())
+    
+    def test_max_items_and_max_chars(self):
+        """Тест ограничения количества и длины выводимых элементов"""
+        # Arrange
+        sink = io.StringIO()
+        
+        @print_result(max_items=2, max_chars=4, sink=sink)
+        def salaries():
+            return {'Анна': 'очень много', 'Андрей': 1, 'Алексей': 2}
+        
+        # Act
+        salaries()
+        
+        # Assert
+        self.assertEqual(sink.getvalue(),
+                         "\nРезультат функции salaries:\n  Анна: очен...\n  Андрей: 1\n  ... ещё 1 элементов\n")
+    
+    def test_background_sink(self):
+        """Тест записи через фоновый поток"""
+        # Arrange
+        stream = io.StringIO()
+        sink = BackgroundSink(stream)
+        
+        @print_result(sink=sink)
+        def identity(x):
+            return x
+        
+        # Act
+        for x in range(100):
+            identity(x)
+        sink.flush()
+        
+        # Assert - весь вывод записан и порядок вызовов сохранён
+        lines = [line.strip() for line in stream.getvalue().splitlines() if line.startswith("  ")]
+        self.assertEqual(lines, [str(x) for x in range(100)])
+    
+    def test_background_sink_write_error(self):
+        """Тест ошибки записи в фоновом потоке"""
+        # Arrange
+        stream = io.StringIO()
+        stream.close()
+        sink = BackgroundSink(stream)
+        
+        # Act - flush не зависает и передаёт ошибку записи
+        sink.write("текст\n")
+        with self.assertRaises(ValueError):
+            sink.flush()
+        
+        # Assert - ошибка передаётся один раз, фоновый поток продолжает работу
+        sink.flush()
+        self.assertTrue(sink.thread.is_alive())
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file